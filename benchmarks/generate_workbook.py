@@ -0,0 +1,134 @@
+"""Synthetic brokerage workbook generator for benchmarking the dashboard pipeline.
+
+Produces multi-year, multi-owner, multi-account transaction histories with the same columns,
+거래종류 values and data quirks (mixed USD/KRW rows, missing 제세금합/단가/통화코드) as real exports.
+
+Usage:
+    python -m benchmarks.generate_workbook 100000 benchmarks/data/tx_100k.xlsx [--years 2015-2025]
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from dividend_core import DIV_KEYWORDS
+
+NON_DIVIDEND_TYPES = ["매수", "매도", "입금", "출금", "이체입금", "이체출금", "외화매수", "외화매도"]
+
+OWNERS = ["아빠", "엄마", "첫째", "둘째"]
+ACCOUNT_TYPES = ["일반", "ISA", "연금저축", "IRP"]
+
+# (종목명, 통화코드, 배당 지급월 목록)
+US_STOCKS = [
+    ("AAPL", "USD", (2, 5, 8, 11)), ("MSFT", "USD", (3, 6, 9, 12)), ("KO", "USD", (4, 7, 10, 12)),
+    ("JNJ", "USD", (3, 6, 9, 12)), ("PEP", "USD", (1, 3, 6, 9)), ("O", "USD", tuple(range(1, 13))),
+    ("SCHD", "USD", (3, 6, 9, 12)), ("JEPI", "USD", tuple(range(1, 13))), ("VYM", "USD", (3, 6, 9, 12)),
+    ("PG", "USD", (2, 5, 8, 11)), ("ABBV", "USD", (2, 5, 8, 11)), ("T", "USD", (2, 5, 8, 11)),
+]
+KR_STOCKS = [
+    ("삼성전자", "KRW", (4, 5, 8, 11)), ("KT&G", "KRW", (4, 5, 8, 11)), ("SK텔레콤", "KRW", (2, 5, 8, 11)),
+    ("하나금융지주", "KRW", (4, 8, 11)), ("KB금융", "KRW", (2, 5, 8, 11)), ("POSCO홀딩스", "KRW", (3, 5, 8, 11)),
+    ("TIGER 미국배당다우존스", "KRW", tuple(range(1, 13))), ("KODEX 고배당", "KRW", (1, 4, 7, 10)),
+]
+
+
+def _accounts(n_owners, accounts_per_owner):
+    return {
+        owner: [f"{owner}-{ACCOUNT_TYPES[i % len(ACCOUNT_TYPES)]}-{i + 1:02d}" for i in range(accounts_per_owner)]
+        for owner in OWNERS[:n_owners]
+    }
+
+
+def generate_transactions(n_rows, years=range(2015, 2026), n_owners=2, accounts_per_owner=3,
+                          dividend_ratio=0.15, seed=0):
+    """Returns `{year: DataFrame}` with about `n_rows` transactions spread evenly over `years`."""
+    rng = np.random.default_rng(seed)
+    years = list(years)
+    stocks = US_STOCKS + KR_STOCKS
+    accounts = _accounts(n_owners, accounts_per_owner)
+    owner_account = [(owner, account) for owner, accs in accounts.items() for account in accs]
+    pay_counts = np.array([len(s[2]) for s in stocks])
+    pay_table = np.array([list(s[2]) + [0] * (12 - len(s[2])) for s in stocks])
+
+    frames = {}
+    rows_per_year = max(1, n_rows // len(years))
+    for year in years:
+        n = rows_per_year
+        is_div = rng.random(n) < dividend_ratio
+        stock_idx = rng.integers(0, len(stocks), n)
+        names = np.array([s[0] for s in stocks], dtype=object)[stock_idx]
+        is_usd = np.array([s[1] == "USD" for s in stocks])[stock_idx]
+
+        # 배당 행은 종목별 지급월에, 나머지 거래는 임의의 월에 배치
+        n_pay = pay_counts[stock_idx]
+        pay_pick = (rng.random(n) * n_pay).astype(int)
+        months = np.where(is_div, pay_table[stock_idx, pay_pick], rng.integers(1, 13, n))
+        days = rng.integers(1, 29, n)
+        dates = pd.to_datetime(dict(year=np.full(n, year), month=months, day=days))
+
+        kinds = np.where(
+            is_div,
+            np.where(is_usd, "배당금외화입금", rng.choice([k for k in DIV_KEYWORDS if k != "배당금외화입금"], n)),
+            rng.choice(NON_DIVIDEND_TYPES, n),
+        )
+
+        fx = np.round(rng.normal(1250 + (year - years[0]) * 15, 40, n), 2)
+        foreign_amount = np.round(rng.lognormal(3.0, 1.0, n), 2)
+        krw_amount = np.where(is_usd, np.round(foreign_amount * fx), np.round(rng.lognormal(11.0, 1.2, n)))
+        tax = np.where(is_usd, np.round(foreign_amount * 0.15, 2), np.round(krw_amount * 0.154))
+
+        pairs = rng.integers(0, len(owner_account), n)
+        df = pd.DataFrame({
+            "거래일자": dates,
+            "거래종류": kinds,
+            "종목명": names,
+            "거래금액": krw_amount,
+            "외화거래금액": np.where(is_usd, foreign_amount, np.nan),
+            "제세금합": np.where(rng.random(n) < 0.1, np.nan, tax),  # 일부 제세금합 누락
+            "단가": np.where(is_usd & (rng.random(n) >= 0.05), fx, np.nan),  # 일부 환율(단가) 누락
+            "통화코드": np.where(is_usd, "USD", np.where(rng.random(n) < 0.3, None, "KRW")),  # 일부 통화코드 누락
+            "계좌": [owner_account[i][1] for i in pairs],
+            "소유주": [owner_account[i][0] for i in pairs],
+            # 대시보드가 사용하지 않는 컬럼 (실제 내보내기 파일과 유사하게)
+            "수량": rng.integers(1, 100, n),
+            "잔고": np.round(rng.lognormal(15, 1, n)),
+            "적요": "",
+        }).sort_values("거래일자", ignore_index=True)
+        frames[year] = df
+    return frames
+
+
+def write_workbook(frames, path):
+    """Writes `{year: DataFrame}` to an .xlsx file with one sheet per year."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with pd.ExcelWriter(path) as writer:
+        for year, df in frames.items():
+            df.to_excel(writer, sheet_name=str(year), index=False)
+
+
+def _parse_years(text):
+    start, _, end = text.partition("-")
+    return range(int(start), int(end or start) + 1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="벤치마크용 가상 거래내역 엑셀 파일 생성")
+    parser.add_argument("rows", type=int, help="전체 거래 행 수 (예: 1000 ~ 1000000)")
+    parser.add_argument("path", help="생성할 .xlsx 파일 경로")
+    parser.add_argument("--years", default="2015-2025", help="연도 범위 (예: 2015-2025)")
+    parser.add_argument("--owners", type=int, default=2)
+    parser.add_argument("--accounts-per-owner", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    frames = generate_transactions(args.rows, _parse_years(args.years), args.owners,
+                                   args.accounts_per_owner, seed=args.seed)
+    write_workbook(frames, args.path)
+    print(f"{sum(len(df) for df in frames.values()):,}행, {len(frames)}개 시트 -> {args.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""Benchmark harness for the ingest and aggregation paths.
+
+Times each pipeline stage (Excel parse, chunked CSV ingest, normalization, cube build, every calendar/summary
+function and the tab4 growth table) on synthetic workbooks of several sizes, reports wall time
+and peak traced memory, and compares the results against a stored baseline.
+
+Usage:
+    python -m benchmarks.run_benchmarks --sizes 1000 10000 100000
+    python -m benchmarks.run_benchmarks --sizes 1000000 --excel-max-rows 0   # Excel 파싱 생략
+    python -m benchmarks.run_benchmarks --save-baseline                      # 현재 결과를 기준으로 저장
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import pandas as pd
+
+from dividend_core import (
+    USED_COLUMNS,
+    build_dividend_cube,
+    build_ttm_panel,
+    create_account_monthly_calendar,
+    create_stock_dividend_calendar,
+    get_annual_dividend_growth,
+    get_dividend_summary_for_selection,
+    get_monthly_details_for_selection,
+    get_monthly_totals,
+    get_year_month_matrix,
+    load_dividend_csv,
+    normalize_dividends,
+    read_workbook,
+    slice_cube,
+    ttm_snapshot,
+    write_report_workbook,
+)
+
+from .generate_workbook import generate_transactions, write_workbook
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(BENCH_DIR, "data")
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+
+
+def measure(fn, repeat=3, memory=True):
+    """Returns `(result, seconds, peak_mb)`: best wall time of `repeat` runs and peak traced memory.
+
+    With `memory=False` the first run is not traced and `peak_mb` is None.
+    """
+    if memory:
+        tracemalloc.start()
+    result = fn()
+    peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024 if memory else None
+    if memory:
+        tracemalloc.stop()
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best, peak
+
+
+def _format_mb(peak_mb):
+    return "-" if peak_mb is None else f"{peak_mb:.1f}"
+
+
+def _workbook_path(rows, seed):
+    return os.path.join(DATA_DIR, f"tx_{rows}_s{seed}.xlsx")
+
+
+def bench_size(rows, excel_max_rows, repeat, seed=0):
+    """Runs every stage for one synthetic dataset and returns `{stage: {"seconds", "peak_mb"}}`.
+
+    `peak_mb` is None for time-only stages.
+    """
+    results = {}
+
+    def record(stage, fn, n=repeat, memory=True):
+        value, seconds, peak_mb = measure(fn, n, memory)
+        results[stage] = {"seconds": round(seconds, 6), "peak_mb": None if peak_mb is None else round(peak_mb, 3)}
+        print(f"  {stage:<36} {seconds * 1000:>10.1f} ms  {_format_mb(peak_mb):>9} MB", flush=True)
+        return value
+
+    frames = generate_transactions(rows, seed=seed)
+
+    if rows <= excel_max_rows:
+        path = _workbook_path(rows, seed)
+        if not os.path.exists(path):
+            write_workbook(frames, path)
+        with open(path, "rb") as f:
+            file_bytes = f.read()
+        # 엑셀 파싱은 느리므로 1회만 측정
+        df_all = record("excel_parse_serial", lambda: read_workbook(file_bytes, parallel=False), n=1)
+        # 작업자 프로세스의 메모리는 tracemalloc에 잡히지 않으므로 시간만 측정
+        record("excel_parse_parallel", lambda: read_workbook(file_bytes, parallel=True), n=1, memory=False)
+    else:
+        df_all = pd.concat(
+            [df[[c for c in USED_COLUMNS if c in df.columns]].assign(연도=year) for year, df in frames.items()],
+            ignore_index=True
+        )
+
+    df_div = record("normalize", lambda: normalize_dividends(df_all.copy()))
+    # 같은 거래내역을 CSV로 내보낸 경우: 청크 단위로 배당 행만 남기므로 최대 메모리가 배당 행 수에 비례
+    csv_bytes = df_all.drop(columns='연도').to_csv(index=False).encode("utf-8-sig")
+    # 기본 인자로 넘겨 측정이 끝나면 람다와 함께 바이트를 놓아 줌
+    record("csv_stream_ingest", lambda data=csv_bytes: load_dividend_csv(io.BytesIO(data)))
+    del csv_bytes
+    cube = record("build_cube", lambda: build_dividend_cube(df_div))
+
+    year = int(cube.index.unique(level='연도').max())
+    owner = cube.index.unique(level='소유주')[0]
+    accounts = slice_cube(cube, 소유주=owner).index.unique(level='계좌').tolist()
+
+    record("monthly_totals (tab1)", lambda: get_monthly_totals(cube))
+    record("year_month_matrix (tab1)", lambda: get_year_month_matrix(cube, '배당금(세전)'))
+    record("create_stock_dividend_calendar", lambda: create_stock_dividend_calendar(cube, year))
+    record("create_account_monthly_calendar", lambda: create_account_monthly_calendar(cube, year))
+    record("get_dividend_summary_for_selection", lambda: get_dividend_summary_for_selection(cube, owner, accounts, year))
+    record("get_monthly_details_for_selection", lambda: get_monthly_details_for_selection(df_div, owner, accounts, year, 3))
+    record("annual_dividend_growth (tab4)", lambda: get_annual_dividend_growth(cube))
+    panel = record("build_ttm_panel (tab5)", lambda: build_ttm_panel(cube))
+    record("ttm_snapshot (tab5)", lambda: ttm_snapshot(panel, panel['ttm'].columns[-1]))
+    record("report_export (xlsx)", lambda: write_report_workbook(cube, io.BytesIO()), n=1)
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Prints the ratio to the baseline per stage and returns the number of regressions."""
+    regressions = 0
+    print("\n기준(baseline) 대비 결과:")
+    for size, stages in results.items():
+        base_stages = baseline.get(size, {})
+        for stage, value in stages.items():
+            base = base_stages.get(stage)
+            if not base or not base["seconds"]:
+                continue
+            ratio = value["seconds"] / base["seconds"]
+            flag = ""
+            if ratio > 1 + tolerance:
+                flag = "  ⚠️ 느려짐"
+                regressions += 1
+            elif ratio < 1 - tolerance:
+                flag = "  ✅ 빨라짐"
+            print(f"  {size:>8}행 {stage:<36} x{ratio:5.2f} "
+                  f"(메모리 {_format_mb(value['peak_mb'])} / {_format_mb(base.get('peak_mb'))} MB){flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="배당 대시보드 처리 단계별 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000], help="전체 거래 행 수 목록")
+    parser.add_argument("--excel-max-rows", type=int, default=200_000,
+                        help="이 행 수 이하일 때만 엑셀 파일을 만들어 파싱 시간을 측정")
+    parser.add_argument("--repeat", type=int, default=3, help="단계별 반복 측정 횟수 (최솟값 사용)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="비교할 기준 결과 JSON")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준으로 저장")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="허용 오차 비율 (기본 20%%)")
+    parser.add_argument("--fail-on-regression", action="store_true", help="기준보다 느려진 단계가 있으면 종료 코드 1")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for rows in args.sizes:
+        print(f"\n[{rows:,}행]")
+        results[str(rows)] = bench_size(rows, args.excel_max_rows, args.repeat)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, ensure_ascii=False, indent=2)
+        print(f"\n기준 결과 저장: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("\n저장된 기준 결과가 없습니다. --save-baseline 으로 먼저 저장하세요.")
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        regressions = compare(results, json.load(f), args.tolerance)
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,65 @@
+import time
+_SCRIPT_START = time.perf_counter() # 시작 시간 측정 (import 시간 포함)
+
+import functools
+import io
+import os
+import platform
+import uuid
+from datetime import datetime
+
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.ticker as ticker
-import numpy as np
-import plotly.graph_objects as go
 import streamlit as st
-import platform
-import matplotlib.font_manager as fm
-import io # BytesIO를 위해 추가
+# matplotlib, plotly 등 무거운 모듈은 실제로 사용하는 시점에 import 합니다.
+from dividend_core import (
+    __version__,
+    active_profiler,
+    amount_table,
+    append_jsonl,
+    bold_rows,
+    DividendStore,
+    IngestCache,
+    StageProfiler,
+    build_dividend_cube,
+    build_ttm_panel,
+    create_account_monthly_calendar,
+    create_stock_dividend_calendar,
+    dividend_baseline,
+    estimate_dividend_growth,
+    estimate_inflation,
+    get_annual_dividend_growth,
+    get_annual_dividends,
+    get_dividend_summary_for_selection,
+    get_monthly_details_for_selection,
+    get_year_month_matrix,
+    load_cpi,
+    load_dividend_csv,
+    load_dividend_data,
+    load_fx_rates,
+    memory_report,
+    page_count,
+    paginate,
+    profile_call,
+    simulate_fire,
+    slice_cube,
+    stage,
+    summarize_fire,
+    write_report_workbook,
+    TTM_MONTHS,
+    ttm_snapshot,
+    ttm_totals,
+)
+
+IMPORT_SECONDS = time.perf_counter() - _SCRIPT_START
+
+
+@st.cache_resource
+def get_startup_metrics():
+    """Process-wide startup timings; the first script run of the process records its (cold) import time."""
+    return {"import_s": round(IMPORT_SECONDS, 4)}
+
+
+get_startup_metrics()
 
 # --- 로그인 정보 설정 (Streamlit Secrets 사용) ---
 # Streamlit Cloud에 배포 시에는 'Secrets'에 설정된 값이 사용됩니다.
@@ -14,6 +67,125 @@ import io # BytesIO를 위해 추가
 USERNAME = st.secrets.get("app_credentials", {}).get("username", "your_username")
 PASSWORD = st.secrets.get("app_credentials", {}).get("password", "your_password")
 
+# --- 업로드 파일 캐시 설정 ---
+# 파싱/정규화된 배당 데이터를 메모리에 보관할 최대 용량(MB). Secrets의 [ingest_cache] max_mb로 변경할 수 있습니다.
+INGEST_CACHE_MAX_MB = st.secrets.get("ingest_cache", {}).get("max_mb", 256)
+
+# --- 엑셀 파싱 설정 ---
+# engine: "auto"(python-calamine 설치 시 사용, 없으면 openpyxl) / "calamine" / "openpyxl"
+# parallel: 연도 시트를 프로세스 풀에서 동시에 파싱 (시트가 많은 큰 파일에서만 이득이 있어 기본은 끔), max_workers: 0이면 CPU 코어 수
+INGEST_ENGINE = st.secrets.get("ingest", {}).get("engine", "auto")
+INGEST_PARALLEL = st.secrets.get("ingest", {}).get("parallel", False)
+INGEST_MAX_WORKERS = st.secrets.get("ingest", {}).get("max_workers", 0)
+# csv_chunksize: CSV 내보내기 파일을 이 행 수만큼씩 읽어 배당 행만 남김 (전체 거래내역을 한 번에 메모리에 올리지 않음)
+INGEST_CSV_CHUNKSIZE = st.secrets.get("ingest", {}).get("csv_chunksize", 100_000)
+
+# --- 표 표시 설정 ---
+# 상세 내역이 이 행 수를 넘으면 페이지로 나누어 표시 (총합 행은 모든 페이지에 표시)
+DETAIL_PAGE_ROWS = st.secrets.get("display", {}).get("detail_page_rows", 500)
+
+# --- 탭 기본 화면 미리 계산 ---
+# 데이터를 불러오면 모든 탭의 기본 화면을 이 수만큼의 작업자 스레드에서 동시에 계산해 캐시에 넣어 둠
+VIEW_PREFETCH_WORKERS = st.secrets.get("views", {}).get("prefetch_workers", 4)
+
+# --- 엑셀 보고서 내보내기 ---
+# 연도 × 소유주 × 계좌별 달력/요약 시트를 이 수만큼의 작업자 스레드에서 계산하면서 한 통합 문서에 순서대로 씀
+REPORT_EXPORT_WORKERS = st.secrets.get("export", {}).get("max_workers", 4)
+
+# --- 차트 캐시 설정 ---
+# 탭1 차트 Figure를 (데이터셋, 연도, 금액 기준, 필터)별로 최대 이 개수만큼 보관 (오래 안 쓴 것부터 제거)
+FIGURE_CACHE_ENTRIES = st.secrets.get("charts", {}).get("figure_cache_entries", 32)
+
+# --- 환율 테이블 설정 ---
+# 단가(환율)가 비어 있는 외화 배당은 이 CSV(날짜, 통화코드, 환율)에서 거래일 이전 가장 가까운 날짜의 환율로 환산
+FX_RATES_PATH = st.secrets.get("fx", {}).get("rates_path", "fx_rates.csv")
+
+# --- FIRE 시뮬레이션 설정 ---
+# 물가 상승률 추정에 사용할 CPI 파일 (연도, CPI). 없으면 기본 가정(연 2.5%)을 사용
+CPI_PATH = st.secrets.get("fire", {}).get("cpi_path", "cpi.csv")
+FIRE_SIMULATION_PATHS = 20_000
+FIRE_HORIZON_YEARS = 40
+FIRE_DEFAULT_MONTHLY_GOAL = 4_000_000
+FIRE_DEFAULT_CONTRIBUTION = 0
+FIRE_DEFAULT_YIELD_PERCENT = 3.5
+
+# --- 로컬 배당 데이터 저장소 설정 ---
+# 업로드된 데이터를 연도별 Parquet 파일로 누적 저장하여 다음 실행 시 엑셀을 다시 읽지 않음
+STORE_ENABLED = st.secrets.get("store", {}).get("enabled", True)
+STORE_PATH = st.secrets.get("store", {}).get("path", "dividend_store")
+
+# --- 시작 시간 측정 기록 ---
+# 프로세스 첫 렌더의 import/렌더 시간을 JSON Lines로 기록하여 릴리스별로 비교할 수 있도록 함 (빈 문자열이면 기록 안 함)
+STARTUP_LOG_PATH = st.secrets.get("metrics", {}).get("startup_log", "startup_metrics.jsonl")
+
+# --- 단계별 성능 측정 (디버그) ---
+# 사이드바에서 켜면 파이프라인 단계와 탭 계산/렌더링마다 시간과 최대 메모리 증가량을 측정하여 표시하고 profile_log에 누적 기록
+# profile = true 이면 측정 옵션이 기본으로 켜짐 (메모리 추적 때문에 측정 중에는 다소 느려짐)
+PROFILE_DEFAULT = st.secrets.get("debug", {}).get("profile", False)
+PROFILE_LOG_PATH = st.secrets.get("debug", {}).get("profile_log", "stage_metrics.jsonl")
+
+@st.cache_resource
+def get_ingest_cache():
+    """Process-wide ingest cache shared across all sessions."""
+    return IngestCache(max_bytes=int(INGEST_CACHE_MAX_MB * 1024 * 1024))
+
+
+@st.cache_resource
+def get_dividend_store():
+    """Process-wide handle to the on-disk dividend store."""
+    return DividendStore(STORE_PATH)
+
+# [1] 한글 폰트 설정 (OS별 자동 적용)
+@st.cache_resource
+def configure_korean_font():
+    """Configures matplotlib's Korean font once per process; returns a warning message or None."""
+    # Streamlit Cloud 환경을 고려하여 폰트 설정 방식을 약간 조정합니다.
+    import matplotlib
+    import matplotlib.font_manager as fm
+
+    try:
+        if platform.system() == 'Windows':
+            font_path = "C:/Windows/Fonts/malgun.ttf"
+            font_name = fm.FontProperties(fname=font_path).get_name()
+            matplotlib.rc("font", family=font_name)
+        elif platform.system() == 'Darwin':  # macOS
+            font_path = "/System/Library/Fonts/AppleGothic.ttf"
+            font_name = fm.FontProperties(fname=font_path).get_name()
+            matplotlib.rc("font", family=font_name)
+        else:  # Linux (Streamlit Cloud는 주로 Linux 기반)
+            # Streamlit Cloud에서는 기본 폰트를 사용하도록 설정
+            matplotlib.rcParams["font.family"] = "sans-serif"
+            matplotlib.rcParams["font.sans-serif"] = ["DejaVu Sans"] # 또는 다른 sans-serif 폰트
+            matplotlib.rcParams["axes.unicode_minus"] = False # 음수 부호 깨짐 방지
+            return "⚠️ Linux 환경 (Streamlit Cloud)에서는 기본 폰트가 사용됩니다. 한글 표시가 다를 수 있습니다."
+
+        matplotlib.rcParams["axes.unicode_minus"] = False # 음수 부호 깨짐 방지
+        return None
+    except Exception as e:
+        matplotlib.rcParams["font.family"] = "sans-serif"
+        matplotlib.rcParams["font.sans-serif"] = ["DejaVu Sans"]
+        matplotlib.rcParams["axes.unicode_minus"] = False
+        return f"⚠️ 폰트 설정 중 오류 발생: {e}. 기본 폰트로 표시됩니다."
+
+
+@st.cache_data(max_entries=4)
+def get_fx_rates(path, version):
+    """Loads the FX table once per file version (`version` is the file's mtime)."""
+    return load_fx_rates(path)
+
+
+@st.cache_data(max_entries=4)
+def get_cpi(path, version):
+    """Loads the CPI table once per file version (`version` is the file's mtime)."""
+    return load_cpi(path)
+
+
+@st.cache_data(max_entries=16)
+def get_memory_report(data_key, _df):
+    """Memory report of the dividend frame, computed once per dataset (keyed by `data_key`)."""
+    return memory_report(_df)
+
+
 # --- 로그인 기능 ---
 def check_password():
     """Returns `True` if the user enters the correct password."""
@@ -43,402 +215,734 @@ def check_password():
     else:
         return True
 
-# --- 앱의 실제 내용 (로그인 성공 시에만 실행) ---
-if check_password(): # 이 문장 아래의 모든 앱 코드는 로그인 성공 시에만 실행됩니다.
+def show_processing_error(e):
+    """Shows the file processing error with the expected workbook layout."""
+    st.error(f"❌ 파일을 처리하는 중 오류가 발생했습니다. 엑셀 파일 형식 및 내용(특히 시트 이름이 연도인지, 필요한 컬럼들이 있는지)을 확인해주세요: {e}")
+    st.info("예상되는 엑셀 컬럼: '거래일자', '거래종류', '종목명', '거래금액', '외화거래금액', '제세금합', '단가', '통화코드', '소유주' 그리고 시트명은 '2024', '2025'와 같은 연도여야 합니다.")
 
-    # [1] 한글 폰트 설정 (OS별 자동 적용)
-    # Streamlit Cloud 환경을 고려하여 폰트 설정 방식을 약간 조정합니다.
+
+# --- 단계별 성능 측정 ---
+def profiling_enabled():
+    return st.session_state.get("profile_toggle", PROFILE_DEFAULT)
+
+
+def write_profile_log(profiler, kind):
+    """Appends the run's stage records to the profile log as JSON lines (failures are ignored)."""
+    if not PROFILE_LOG_PATH or not profiler.records:
+        return
     try:
-        if platform.system() == 'Windows':
-            font_path = "C:/Windows/Fonts/malgun.ttf"
-            font_name = fm.FontProperties(fname=font_path).get_name()
-            plt.rc("font", family=font_name)
-        elif platform.system() == 'Darwin':  # macOS
-            font_path = "/System/Library/Fonts/AppleGothic.ttf"
-            font_name = fm.FontProperties(fname=font_path).get_name()
-            plt.rc("font", family=font_name)
-        else:  # Linux (Streamlit Cloud는 주로 Linux 기반)
-            # Streamlit Cloud에서는 기본 폰트를 사용하도록 설정
-            plt.rcParams["font.family"] = "sans-serif"
-            plt.rcParams["font.sans-serif"] = ["DejaVu Sans"] # 또는 다른 sans-serif 폰트
-            st.warning("⚠️ Linux 환경 (Streamlit Cloud)에서는 기본 폰트가 사용됩니다. 한글 표시가 다를 수 있습니다.")
+        profiler.write_jsonl(PROFILE_LOG_PATH, timestamp=datetime.now().isoformat(timespec="seconds"),
+                             run_id=uuid.uuid4().hex[:8], kind=kind, version=__version__)
+    except OSError:
+        pass # 기록 실패는 대시보드 사용에 영향을 주지 않음
+
+
+def profile_table(records):
+    """Per-stage totals of one run for the debug panel (nested stages are indented)."""
+    df = pd.DataFrame(records)
+    if 'peak_mb' not in df.columns:
+        df['peak_mb'] = float('nan')
+    table = df.groupby('stage', sort=False).agg(
+        depth=('depth', 'min'), calls=('seconds', 'size'), seconds=('seconds', 'sum'), peak_mb=('peak_mb', 'max')
+    )
+    return pd.DataFrame({
+        '단계': ['· ' * depth + name for name, depth in zip(table.index, table['depth'])],
+        '호출': table['calls'].to_numpy(),
+        '시간(ms)': (table['seconds'] * 1000).round(1).to_numpy(),
+        '최대 메모리 증가(MB)': table['peak_mb'].round(2).to_numpy(),
+    })
+
+
+# --- 탭별 계산 결과 캐시 ---
+def view_task(data_key, fn, source, *args):
+    """Returns `(cache_key, compute)` for `fn(source, *args)` on the dataset identified by `data_key`."""
+    # 위젯 값은 numpy 정수 등으로 들어올 수 있으므로 문자열로 키를 만듦
+    key = f"view:{data_key}|{fn.__name__}|" + "|".join(map(str, args))
+    return key, lambda: profile_call(fn.__name__, fn, source, *args)
+
+
+def cached_view(data_key, fn, source, *args):
+    """Returns `fn(source, *args)` from the process-wide cache (computed once per dataset and arguments)."""
+    return get_ingest_cache().get_or_compute(*view_task(data_key, fn, source, *args))[0]
+
+
+def current_inflation():
+    """Returns `(inflation, cpi_version)`: the (mu, sigma) estimate from the CPI file, or the default."""
+    cpi_version = os.stat(CPI_PATH).st_mtime_ns if CPI_PATH and os.path.exists(CPI_PATH) else None
+    return estimate_inflation(get_cpi(CPI_PATH, cpi_version) if cpi_version else None), cpi_version
+
+
+def project_fire(cube, monthly_goal, monthly_contribution, dividend_yield, inflation):
+    """Runs the FIRE simulation from the trailing-12-month dividends; returns the baseline and summary."""
+    base_year, ttm_dividends, complete_years = dividend_baseline(cube)
+    growth = estimate_dividend_growth(complete_years)
+
+    # 같은 난수(seed)를 사용하므로 슬라이더를 움직여도 결과가 흔들리지 않음
+    years_to_goal = simulate_fire(
+        ttm_dividends, monthly_goal, growth=growth, inflation=inflation,
+        monthly_contribution=monthly_contribution, dividend_yield=dividend_yield,
+        horizon=FIRE_HORIZON_YEARS, paths=FIRE_SIMULATION_PATHS
+    )
+    return {"ttm": ttm_dividends, "growth": growth, "summary": summarize_fire(years_to_goal, base_year)}
+
+
+def default_view_tasks(data_key, cube, df_div):
+    """Cache tasks for the first render of every tab, i.e. each widget at its default value."""
+    if cube.empty:
+        return {}
+    year = max(cube.index.unique(level='연도'))
+    inflation, _ = current_inflation()
+    tasks = [
+        view_task(data_key, get_year_month_matrix, cube, '배당금(세전)', None),
+        view_task(data_key, create_stock_dividend_calendar, cube, year, '배당금(세전)', '전체 계좌'),
+        view_task(data_key, create_account_monthly_calendar, cube, year, '배당금(세전)', '전체 계좌'),
+        view_task(data_key, get_annual_dividends, cube),
+        view_task(data_key, get_annual_dividend_growth, cube),
+        view_task(data_key, build_ttm_panel, cube, '종목명', '배당금(세후)', None),
+        view_task(data_key, project_fire, cube, FIRE_DEFAULT_MONTHLY_GOAL, FIRE_DEFAULT_CONTRIBUTION,
+                  FIRE_DEFAULT_YIELD_PERCENT / 100, inflation),
+    ]
+    owners = sorted(cube.index.unique(level='소유주').tolist()) if '소유주' in df_div.columns else []
+    if owners:
+        accounts = sorted(slice_cube(cube, 소유주=owners[0]).index.unique(level='계좌').tolist())
+        tasks += [
+            view_task(data_key, get_dividend_summary_for_selection, cube, owners[0], accounts, year, '배당금(세전)'),
+            view_task(data_key, get_monthly_details_for_selection, df_div, owners[0], accounts, year, 1, '배당금(세전)'),
+        ]
+    return dict(tasks)
+
+
+# --- 탭1 차트 (연도 × 월 행렬에서 바로 생성, 결과 Figure는 캐시) ---
+CHART_LAYOUT = dict(plot_bgcolor='black', paper_bgcolor='black', font=dict(color='white'))
+MONTH_LABELS = [f"{m}월" for m in range(1, 13)]
+
+
+def build_monthly_figure(matrix, year, dividend_type):
+    """Bar chart of one year's monthly totals from a 연도 × 월 matrix."""
+    import plotly.graph_objects as go # 차트를 그릴 때만 plotly를 불러옴
+
+    values = matrix.loc[year].to_numpy()
+    bars = go.Bar(
+        x=MONTH_LABELS,
+        y=values,
+        text=[f"{v:,}원" if v > 0 else "" for v in values],
+        textposition='outside',
+        marker_color='orange',
+        name=dividend_type
+    )
+    layout = go.Layout(
+        title=f"{year}년 {dividend_type} (총합: {int(values.sum()):,}원)",
+        yaxis=dict(title='금액 (원)', tickformat=","),  # 천단위 , 표시
+        xaxis=dict(title='월', tickmode='array', tickvals=list(range(12)), ticktext=MONTH_LABELS),
+        height=500,
+        **CHART_LAYOUT
+    )
+    fig = go.Figure(data=[bars], layout=layout)
+    fig.update_traces(marker_line_color='black', marker_line_width=1.5)
+    return fig
+
+
+def build_multi_year_figure(matrix, years, dividend_type, stacked):
+    """Overlay (one line per year) or stacked (months stacked per year) chart of several years.
+
+    Traces carry only numeric arrays, which plotly sends as compact typed arrays; labels come from
+    the axis ticks and a shared hover template instead of per-point text.
+    """
+    import plotly.graph_objects as go # 차트를 그릴 때만 plotly를 불러옴
+
+    matrix = matrix.loc[list(years)]
+    year_values = matrix.index.to_numpy()
+    if stacked:
+        traces = [
+            go.Bar(x=year_values, y=matrix[month].to_numpy(), name=MONTH_LABELS[month - 1],
+                   hovertemplate="%{x}년: %{y:,}원")
+            for month in matrix.columns
+        ]
+        xaxis = dict(title='연도', type='category')
+    else:
+        months = matrix.columns.to_numpy()
+        traces = [
+            go.Scatter(x=months, y=row, mode='lines+markers', name=f"{year}년", hovertemplate="%{x}월: %{y:,}원")
+            for year, row in zip(year_values, matrix.to_numpy())
+        ]
+        xaxis = dict(title='월', tickmode='array', tickvals=list(range(1, 13)), ticktext=MONTH_LABELS)
+
+    period = f"{years[0]}~{years[-1]}" if len(years) > 1 else f"{years[0]}"
+    fig = go.Figure(data=traces)
+    fig.update_layout(
+        title=f"{period}년 {dividend_type} (총합: {int(matrix.to_numpy().sum()):,}원)",
+        yaxis=dict(title='금액 (원)', tickformat=","),
+        xaxis=xaxis,
+        barmode='stack' if stacked else None,
+        height=500,
+        **CHART_LAYOUT
+    )
+    return fig
+
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def get_monthly_figure(data_key, year, dividend_type, _matrix):
+    """One-year chart, built once per (dataset, year, amount type); least recently used are evicted."""
+    return build_monthly_figure(_matrix, year, dividend_type)
+
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def get_multi_year_figure(data_key, years, dividend_type, owners, stacked, _matrix):
+    """Multi-year chart, built once per (dataset, year set, amount type, owner filter, mode)."""
+    return build_multi_year_figure(_matrix, years, dividend_type, stacked)
+
+
+# --- 대시보드 탭 (탭마다 독립적으로 다시 실행되는 fragment) ---
+def tab_fragment(render):
+    """Runs `render` as a fragment so that its widgets rerun only that tab; errors are shown in the tab."""
+    @functools.wraps(render)
+    def wrapper(*args, **kwargs):
+        # 탭만 단독으로 다시 실행될 때는 전체 실행의 측정이 없으므로 이 탭의 측정을 따로 기록
+        profiler = StageProfiler().start() if profiling_enabled() and active_profiler() is None else None
+        try:
+            with stage("render:" + render.__name__):
+                render(*args, **kwargs)
+        except Exception as e:
+            show_processing_error(e)
+        finally:
+            if profiler is not None:
+                profiler.stop()
+                write_profile_log(profiler, "fragment")
+    return st.fragment(wrapper)
+
+
+def build_report_workbook(cube, dividend_type):
+    """Returns the bulk Excel report of every year × owner × account as `.xlsx` bytes."""
+    buffer = io.BytesIO()
+    write_report_workbook(cube, buffer, dividend_type, max_workers=REPORT_EXPORT_WORKERS)
+    return buffer.getvalue()
+
+
+@tab_fragment
+def render_report_export(data_key, cube):
+    """Sidebar: builds the bulk Excel report on request and offers it for download."""
+    st.header("엑셀 보고서 내보내기")
+    dividend_type = st.radio('보고서 금액 기준:', ['배당금(세전)', '배당금(세후)'], index=1, key='export_type_select')
+    report_id = f"{data_key}|{dividend_type}"
+    if st.button("보고서 만들기", key='export_build_button'):
+        st.session_state['export_report_id'] = report_id
+    # 보고서는 버튼을 누른 데이터셋/금액 기준에 대해서만 만들고, 만든 결과는 캐시에서 재사용
+    if st.session_state.get('export_report_id') == report_id:
+        with st.spinner("보고서를 만드는 중..."):
+            report = cached_view(data_key, build_report_workbook, cube, dividend_type)
+        st.download_button(
+            "📥 엑셀 보고서 다운로드", report, file_name=f"배당_보고서_{dividend_type}.xlsx",
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", key='export_download_button'
+        )
+    st.caption("연도별 종목/계좌 달력, 소유주별 요약, 소유주 × 계좌별 종목 달력과 연도별 성장률을 시트별로 담습니다.")
+
+
+def show_amount_table(df, columns=None, blank_zero=True, formats=None, total_rows=()):
+    """Shows `df` with its amount columns (default: all numeric) as thousands-separated numbers and `total_rows` in bold.
+
+    `formats` maps other numeric columns to a format string (e.g. `'{:.2f}%'`). The values
+    stay numeric, so the columns sort as numbers; zeros are blank when `blank_zero`.
+    """
+    if columns is None:
+        columns = df.select_dtypes(include='number').columns.difference(list(formats or {}), sort=False)
+    table = amount_table(df, columns, blank_zero)
+    st.dataframe(bold_rows(table, total_rows, [str(col) for col in columns], formats), use_container_width=True)
+
+
+@tab_fragment
+def render_chart_tab(data_key, cube):
+    """Tab 1: monthly dividend bar chart of one year, or all years overlaid/stacked."""
+    st.header("📈 연도별 월별 배당금 차트")
+    if not cube.empty:
+        chart_view = st.radio('차트 보기:', ['연도별 월별', '여러 연도 비교'], horizontal=True, key='chart_view_select')
+
+        if chart_view == '연도별 월별':
+            col1, col2 = st.columns(2)
+            with col2:
+                dividend_type_chart = st.radio('차트 금액 기준:', ['배당금(세전)', '배당금(세후)'], key='chart_type_select')
+            matrix = cached_view(data_key, get_year_month_matrix, cube, dividend_type_chart, None)
+            with col1:
+                years = sorted(matrix.index, reverse=True)
+                selected_year_chart = st.selectbox('차트 연도 선택:', years, index=0, key='chart_year_select')
+
+            fig = get_monthly_figure(data_key, int(selected_year_chart), dividend_type_chart, matrix)
+        else:
+            owners = sorted(cube.index.unique(level='소유주').tolist()) if '소유주' in cube.index.names else []
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                dividend_type_chart = st.radio('차트 금액 기준:', ['배당금(세전)', '배당금(세후)'], key='chart_type_select')
+            with col2:
+                selected_owners = st.multiselect('소유주 선택:', owners, default=owners, key='chart_owners_select')
+            with col3:
+                chart_mode = st.radio('표시 방식:', ['겹쳐 보기', '누적 막대'], key='chart_mode_select')
+
+            # 소유주를 모두 선택하면 필터 없는 행렬을 그대로 재사용
+            owner_filter = None if set(selected_owners) == set(owners) else tuple(selected_owners)
+            matrix = cached_view(data_key, get_year_month_matrix, cube, dividend_type_chart, owner_filter)
+            all_years = sorted(matrix.index)
+            selected_years = st.multiselect('비교할 연도:', all_years, default=all_years, key='chart_years_select')
+            if not selected_years or matrix.empty:
+                st.info("선택한 조건에 해당하는 배당 데이터가 없습니다.")
+                return
+
+            fig = get_multi_year_figure(data_key, tuple(sorted(int(y) for y in selected_years)), dividend_type_chart,
+                                        owner_filter, chart_mode == '누적 막대', matrix)
+        st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.info("차트를 표시할 데이터가 없습니다.")
 
-        plt.rcParams["axes.unicode_minus"] = False # 음수 부호 깨짐 방지
-    except Exception as e:
-        st.warning(f"⚠️ 폰트 설정 중 오류 발생: {e}. 기본 폰트로 표시됩니다.")
-        plt.rcParams["font.family"] = "sans-serif"
-        plt.rcParams["font.sans-serif"] = ["DejaVu Sans"]
-        plt.rcParams["axes.unicode_minus"] = False
 
+@tab_fragment
+def render_calendar_tab(data_key, cube):
+    """Tab 2: stock and account calendars of one year."""
+    st.header("📅 연도별 배당 달력")
 
-    st.set_page_config(layout="wide") # 페이지 레이아웃을 넓게 설정
+    if not cube.empty:
+        years_calendar = sorted(cube.index.unique(level='연도'), reverse=True)
 
-    st.title("💰 배당금 분석 대시보드")
-    st.markdown("엑셀 파일을 업로드하여 배당금 내역을 분석하고 시각화합니다.")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            selected_year_calendar = st.selectbox('달력 연도 선택:', years_calendar, index=0, key='calendar_year_select')
+        with col2:
+            dividend_type_calendar = st.radio('달력 금액 기준:', ['배당금(세전)', '배당금(세후)'], key='calendar_type_select')
+        with col3:
+            all_accounts = ['전체 계좌'] + sorted(cube.index.unique(level='계좌').tolist())
+            selected_account_calendar = st.selectbox('계좌 선택:', all_accounts, key='account_calendar_select')
 
-    # [2] 사용자 파일 선택 -> Streamlit의 file_uploader로 변경
-    uploaded_file = st.file_uploader("배당 거래내역 엑셀 파일을 선택하세요", type=["xlsx", "xls"])
+        # --- 기존: 종목별 배당 달력 ---
+        st.subheader(f"--- {selected_year_calendar}년 {selected_account_calendar} 종목별 배당 달력 ---")
+        df_stock_calendar = cached_view(data_key, create_stock_dividend_calendar, cube, selected_year_calendar, dividend_type_calendar, selected_account_calendar)
 
-    df_div = pd.DataFrame() # 전역 변수로 df_div 선언
+        if df_stock_calendar.empty:
+            st.info(f"{selected_year_calendar}년 {selected_account_calendar}에 해당하는 종목별 배당 데이터가 없습니다.")
+        else:
+            # 금액은 숫자 그대로 두고 표의 열 설정으로 천 단위 구분 (셀 단위 Styler 콜백 없음, 숫자로 정렬됨)
+            show_amount_table(df_stock_calendar, total_rows=['총합'])
 
-    if uploaded_file is not None:
-        try:
-            # BytesIO를 사용하여 메모리에서 파일 읽기
-            xls = pd.ExcelFile(io.BytesIO(uploaded_file.getvalue()))
-            sheet_names = xls.sheet_names
-            
-            # [3] 엑셀 파일 읽기 및 시트 병합
-            df_all = pd.concat(
-                [xls.parse(sheet).assign(연도=int(sheet)) for sheet in sheet_names],
-                ignore_index=True
+        st.markdown("---") # 구분선 추가
+
+        # --- 새로 추가: 계좌별 월별 배당 달력 ---
+        st.subheader(f"--- {selected_year_calendar}년 {selected_account_calendar} 계좌별 월별 배당 달력 ---")
+        df_account_calendar = cached_view(data_key, create_account_monthly_calendar, cube, selected_year_calendar, dividend_type_calendar, selected_account_calendar)
+
+        if df_account_calendar.empty:
+            st.info(f"{selected_year_calendar}년 {selected_account_calendar}에 해당하는 계좌별 배당 데이터가 없습니다.")
+        else:
+            show_amount_table(df_account_calendar, total_rows=['전체 총합'])
+
+    else:
+        st.info("달력을 표시할 데이터가 없습니다.")
+
+
+@tab_fragment
+def render_detail_tab(data_key, cube, df_div):
+    """Tab 3: per-account monthly summary and the payouts of one month."""
+    st.header("📊 계좌별/월별 상세 배당 내역")
+
+    if not df_div.empty:
+        if '소유주' not in df_div.columns:
+            st.warning("⚠️ '소유주' 컬럼이 데이터에 없습니다. 엑셀 파일에 '소유주' 컬럼을 확인해주세요.")
+            owners = []
+        else:
+            owners = sorted(cube.index.unique(level='소유주').tolist())
+
+        years_account = sorted(cube.index.unique(level='연도').tolist(), reverse=True)
+        months_account = list(range(1, 13))
+
+        if not owners:
+            st.info("선택할 수 있는 소유주가 없습니다.")
+        elif not years_account:
+            st.info("선택할 수 있는 연도가 없습니다.")
+        else:
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                selected_owner = st.selectbox('소유주 선택:', owners, key='owner_select')
+
+            # 소유주 선택에 따라 계좌 목록 업데이트
+            filtered_accounts = []
+            if selected_owner:
+                filtered_accounts = sorted(slice_cube(cube, 소유주=selected_owner).index.unique(level='계좌').tolist())
+
+            with col2:
+                selected_accounts = st.multiselect(
+                    '계좌 선택 (다중 선택 가능):',
+                    options=filtered_accounts,
+                    default=filtered_accounts, # 기본적으로 모든 계좌 선택
+                    key='account_select'
+                )
+            with col3:
+                selected_year_account = st.selectbox('연도 선택:', years_account, key='year_account_select')
+            with col4:
+                selected_month_account = st.selectbox('월 선택:', months_account, key='month_account_select')
+
+            dividend_type_account = st.radio('금액 기준:', ['배당금(세전)', '배당금(세후)'], key='type_account_select')
+
+            if selected_owner and selected_accounts and selected_year_account: # 월 선택은 상세에만 영향
+                # 이 부분이 '계좌별 월별 요약' 테이블입니다.
+                st.subheader(f"--- 소유주: {selected_owner}, 연도: {selected_year_account} - 선택 계좌별 월별 {dividend_type_account} 요약 ---")
+                summary_df = cached_view(data_key, get_dividend_summary_for_selection, cube, selected_owner, selected_accounts, selected_year_account, dividend_type_account)
+                if summary_df.empty:
+                    st.info("선택된 소유주, 계좌 및 연도에 배당 내역이 없습니다.")
+                else:
+                    show_amount_table(summary_df, total_rows=['전체 총합'])
+
+                # 이 부분이 '상세 내역' 테이블입니다.
+                st.subheader(f"\n--- 소유주: {selected_owner}, 계좌: {', '.join(selected_accounts)}, 연도: {selected_year_account}년 {selected_month_account}월 - {dividend_type_account} 상세 내역 ---")
+                details_df = cached_view(data_key, get_monthly_details_for_selection, df_div, selected_owner, selected_accounts, selected_year_account, selected_month_account, dividend_type_account)
+                if details_df.empty:
+                    st.info(f"선택된 소유주, 계좌, {selected_year_account}년 {selected_month_account}월에 배당 내역이 없습니다.")
+                else:
+                    # 행이 많으면 페이지 단위로 잘라서 표시 (마지막 총합 행은 항상 포함)
+                    pages = page_count(len(details_df) - 1, DETAIL_PAGE_ROWS)
+                    if pages > 1:
+                        detail_page = st.number_input(f'페이지 (총 {pages}쪽, {len(details_df) - 1:,}건):', min_value=1,
+                                                      max_value=pages, value=1, step=1, key='detail_page_select')
+                        details_df = paginate(details_df, int(detail_page), DETAIL_PAGE_ROWS, keep_last=True)
+                    total_rows = details_df.index[details_df['거래일자'] == '총합']
+                    show_amount_table(details_df, columns=['배당금(세전)', '제세금합', '배당금(세후)'], blank_zero=False,
+                                      total_rows=total_rows)
+            else:
+                st.info("소유주, 하나 이상의 계좌, 연도, 그리고 월을 선택해주세요.")
+    else:
+        st.info("상세 내역을 표시할 데이터가 없습니다.")
+
+
+@tab_fragment
+def render_fire_tab(data_key, cube):
+    """Tab 4: FIRE progress, dividend growth and the Monte Carlo projection."""
+    st.header("🔥 FIRE 현황 분석")
+    # 사용자 지정 FIRE 전략 정보 반영 (기본값: 월 생활비 4백만원)
+    monthly_fire_goal = st.slider('목표 월 생활비 (원):', min_value=500_000, max_value=20_000_000,
+                                  value=FIRE_DEFAULT_MONTHLY_GOAL, step=100_000, format="%d", key='fire_goal_slider')
+    st.markdown(f"**목표 월 생활비:** {monthly_fire_goal:,.0f}원")
+    st.markdown(f"**FIRE 전략:** 배당금으로 생활, 월 {monthly_fire_goal / 10_000:,.0f}만원 생활비 목표, 배당 성장을 통한 인플레이션 극복")
+
+    if not cube.empty:
+        annual_after_tax = cached_view(data_key, get_annual_dividends, cube)
+        current_year = annual_after_tax.index.max()
+        current_year_div = annual_after_tax.loc[current_year]
+
+        # 월별 목표 계산 (사용자 정보 반영)
+        annual_fire_goal = monthly_fire_goal * 12
+
+        st.subheader(f"{current_year}년 FIRE 목표 달성 현황")
+        st.write(f"현재까지 {current_year}년 총 세후 배당금: **{int(current_year_div):,}원**")
+        st.write(f"연간 FIRE 목표 금액: **{annual_fire_goal:,.0f}원**")
+
+        progress_percent = (current_year_div / annual_fire_goal) * 100 if annual_fire_goal > 0 else 0
+        st.progress(min(float(progress_percent / 100), 1.0), text=f"목표 달성률: **{progress_percent:.2f}%**")
+
+        if current_year_div >= annual_fire_goal:
+            st.success("🎉 축하합니다! 올해 FIRE 목표를 달성했습니다!")
+        elif current_year_div > 0:
+            st.info(f"올해 목표까지 **{int(annual_fire_goal - current_year_div):,}원**이 부족합니다.")
+        else:
+            st.info("아직 올해 배당금이 없습니다. 목표 달성을 위해 노력해봅시다!")
+
+        st.subheader("인플레이션 극복을 위한 배당 성장률")
+
+        # 연도별 배당금 합계 및 전년 대비 성장률 계산
+        if len(annual_after_tax) < 2:
+            st.info("배당 성장률을 계산하기 위한 충분한 연도별 데이터(최소 2년)가 필요합니다.")
+        else:
+            annual_dividends = cached_view(data_key, get_annual_dividend_growth, cube)
+
+            show_amount_table(annual_dividends, columns=['배당금(세후)', '전년도_배당금'], blank_zero=False,
+                              formats={'성장률': '{:.2f}%'})
+
+            st.info("⚠️ **참고:** FIRE 전략에는 '배당 성장을 통한 인플레이션 극복'이 포함되어 있습니다. 위에 표시된 성장률이 물가 상승률보다 높은지 주기적으로 확인하는 것이 중요합니다. 아래 시뮬레이션은 CPI 파일이 있으면 실제 물가 상승률을 반영합니다.")
+
+        # --- FIRE 달성 시점 몬테카를로 시뮬레이션 ---
+        st.subheader("🎲 FIRE 달성 시점 시뮬레이션")
+        col1, col2 = st.columns(2)
+        with col1:
+            monthly_contribution = st.slider('월 추가 투자금 (원):', min_value=0, max_value=10_000_000,
+                                             value=FIRE_DEFAULT_CONTRIBUTION, step=100_000, format="%d",
+                                             key='fire_contribution_slider')
+        with col2:
+            dividend_yield_percent = st.slider('신규 투자 세후 배당수익률 (%):', min_value=0.0, max_value=10.0,
+                                               value=FIRE_DEFAULT_YIELD_PERCENT, step=0.1, key='fire_yield_slider')
+
+        inflation, cpi_version = current_inflation()
+        projection = cached_view(data_key, project_fire, cube, monthly_fire_goal, monthly_contribution,
+                                 dividend_yield_percent / 100, inflation)
+        ttm_dividends, growth, fire_summary = projection["ttm"], projection["growth"], projection["summary"]
+
+        st.caption(
+            f"기준: 최근 12개월 세후 배당금 {ttm_dividends:,.0f}원 · "
+            f"배당 성장률 연 {growth[0] * 100:.1f}% (±{growth[1] * 100:.1f}%) · "
+            f"물가 상승률 연 {inflation[0] * 100:.1f}% (±{inflation[1] * 100:.1f}%)"
+            f"{'' if cpi_version else ' (CPI 파일 없음: 기본 가정)'} · "
+            f"{FIRE_SIMULATION_PATHS:,}개 경로, 최대 {FIRE_HORIZON_YEARS}년"
+        )
+        st.caption("과거 배당 성장률에는 그동안의 추가 투자 효과가 포함되어 있으므로, 추가 투자금과 함께 사용하면 다소 낙관적일 수 있습니다.")
+
+        col1, col2, col3, col4 = st.columns(4)
+        percentiles = fire_summary["percentiles"]
+        col1.metric(f"{FIRE_HORIZON_YEARS}년 내 달성 확률", f"{fire_summary['probability'] * 100:.1f}%")
+        col2.metric("낙관 (10%)", f"{percentiles[10]}년" if percentiles[10] else "미달성")
+        col3.metric("중앙값 (50%)", f"{percentiles[50]}년" if percentiles[50] else "미달성")
+        col4.metric("보수 (90%)", f"{percentiles[90]}년" if percentiles[90] else "미달성")
+
+        distribution = fire_summary["distribution"]
+        if not distribution.empty:
+            import plotly.graph_objects as go # 차트를 그릴 때만 plotly를 불러옴
+
+            fig = go.Figure(data=[
+                go.Bar(x=distribution['연도'], y=distribution['확률'] * 100, name='연도별 달성 확률', marker_color='orange'),
+                go.Scatter(x=distribution['연도'], y=distribution['누적확률'] * 100, name='누적 달성 확률',
+                           mode='lines+markers', line=dict(color='white')),
+            ])
+            fig.update_layout(
+                title="목표 월 생활비 달성 연도 분포",
+                yaxis=dict(title='확률 (%)'),
+                xaxis=dict(title='연도'),
+                plot_bgcolor='black',
+                paper_bgcolor='black',
+                font=dict(color='white'),
+                height=400
             )
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info(f"현재 가정으로는 {FIRE_HORIZON_YEARS}년 안에 목표를 달성하는 경로가 없습니다. 추가 투자금을 늘려보세요.")
+    else:
+        st.info("FIRE 현황을 분석할 데이터가 없습니다.")
+
+
+@tab_fragment
+def render_ttm_tab(data_key, cube):
+    """Tab 5: trailing-12-month income, per-holding TTM growth and dividend-cut detection."""
+    st.header("📆 최근 12개월(TTM) 배당 분석")
+    if cube.empty:
+        st.info("TTM 분석을 할 데이터가 없습니다.")
+        return
+
+    owners = sorted(cube.index.unique(level='소유주').tolist()) if '소유주' in cube.index.names else []
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        ttm_level = st.radio('분석 단위:', ['종목명', '계좌'], horizontal=True, key='ttm_level_select')
+    with col2:
+        dividend_type_ttm = st.radio('TTM 금액 기준:', ['배당금(세전)', '배당금(세후)'], index=1, key='ttm_type_select')
+    with col3:
+        selected_owner_ttm = st.selectbox('소유주:', ['전체 소유주'] + owners, key='ttm_owner_select')
+
+    # 데이터셋·조건별로 (종목/계좌 × 월) 패널을 한 번만 만들고, 기준월/감소 기준은 패널을 잘라서 계산
+    owner_filter = None if selected_owner_ttm == '전체 소유주' else (selected_owner_ttm,)
+    panel = cached_view(data_key, build_ttm_panel, cube, ttm_level, dividend_type_ttm, owner_filter)
+    if panel is None:
+        st.info("선택한 조건에 해당하는 배당 데이터가 없습니다.")
+        return
+
+    months = panel['ttm'].columns
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        as_of = st.select_slider('기준월:', options=list(months), value=months[-1], format_func=str, key='ttm_month_select')
+    with col2:
+        cut_percent = st.slider('감소 판단 기준 (직전 지급 대비 %):', min_value=5, max_value=50, value=10, step=5,
+                                key='ttm_cut_slider')
+
+    totals = ttm_totals(panel)
+    current = totals.loc[as_of]
+    snapshot = ttm_snapshot(panel, as_of, cut_threshold=cut_percent / 100)
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric(f"{as_of} 기준 TTM 배당금", f"{current['TTM 배당금']:,.0f}원")
+    col2.metric("월 평균", f"{current['TTM 배당금'] / 12:,.0f}원")
+    col3.metric("1년 전 대비", f"{current['TTM 성장률(%)']:+.1f}%" if pd.notna(current['TTM 성장률(%)']) else "-")
+    col4.metric("감소/중단", f"{int(snapshot['상태'].isin(['감소', '중단']).sum())}건")
+    if months.get_loc(as_of) < TTM_MONTHS - 1:
+        st.caption("⚠️ 기준월까지의 데이터가 12개월 미만이라 TTM이 실제보다 작게 계산됩니다.")
+
+    import plotly.graph_objects as go # 차트를 그릴 때만 plotly를 불러옴
+
+    fig = go.Figure(go.Scatter(
+        x=totals.index.astype(str), y=totals['TTM 배당금'].round().to_numpy(), mode='lines',
+        line=dict(color='orange'), name='TTM 배당금', hovertemplate="%{x}: %{y:,}원<extra></extra>"
+    ))
+    fig.add_vline(x=months.get_loc(as_of), line_dash='dot', line_color='white')
+    fig.update_layout(
+        title=f"월별 TTM {dividend_type_ttm} 추이",
+        yaxis=dict(title='금액 (원)', tickformat=","),
+        xaxis=dict(title='기준월', type='category'),
+        height=400,
+        **CHART_LAYOUT
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.subheader(f"--- {as_of} 기준 {ttm_level}별 TTM ---")
+    if snapshot.empty:
+        st.info("기준월까지 최근 2년간 배당 내역이 없습니다.")
+    else:
+        show_amount_table(snapshot, columns=['TTM 배당금', '1년 전 TTM', '최근 지급액'], blank_zero=False,
+                          formats={'TTM 성장률(%)': '{:+.1f}%', '직전 대비(%)': '{:+.1f}%'})
+        st.caption("상태: 중단 = 1년 전 12개월에는 지급했으나 최근 12개월 지급 없음 · 감소 = 최근 지급액이 직전 지급액보다 기준 이상 감소 · "
+                   "신규 = 1년 전 12개월에는 지급 없음. 지급액 변화에는 보유 수량의 변화(매수/매도)도 반영됩니다. "
+                   "외화 배당은 원화 환산액으로 비교하므로, 주당 배당금이 그대로여도 환율이 기준 이상 움직이면 감소로 표시될 수 있습니다.")
 
-            # [4] 날짜 처리 및 배당 필터링
-            df_all["거래일자"] = pd.to_datetime(df_all["거래일자"], errors='coerce')
-            div_keywords = ["배당금외화입금", "배당금입금", "ETF분배금입금", "현금배당", "ETF/상장클래스 분배금입금"]
-            df_div = df_all[df_all["거래종류"].isin(div_keywords)].copy()
 
-            # [5] 결측값 처리 및 배당금 계산
-            df_div["제세금합"] = df_div["제세금합"].fillna(0)
-            df_div["단가"] = df_div["단가"].fillna(1)
-            df_div["통화코드"] = df_div["통화코드"].fillna("KRW")
-            df_div["배당금(세전)"] = 0.0
-            df_div["배당금(세후)"] = 0.0
+# --- 앱의 실제 내용 (로그인 성공 시에만 실행) ---
+if check_password(): # 이 문장 아래의 모든 앱 코드는 로그인 성공 시에만 실행됩니다.
 
-            mask_us = df_div["통화코드"] == "USD"
-            df_div.loc[mask_us, "배당금(세전)"] = df_div.loc[mask_us, "외화거래금액"] * df_div.loc[mask_us, "단가"]
-            df_div.loc[mask_us, "배당금(세후)"] = (df_div.loc[mask_us, "외화거래금액"] - df_div.loc[mask_us, "제세금합"]) * df_div.loc[mask_us, "단가"]
+    # 단계별 성능 측정 (사이드바에서 켠 경우에만)
+    profiler = StageProfiler().start() if profiling_enabled() else None
 
-            mask_kr = df_div["통화코드"] != "USD"
-            df_div.loc[mask_kr, "배당금(세전)"] = df_div.loc[mask_kr, "거래금액"]
-            df_div.loc[mask_kr, "배당금(세후)"] = df_div.loc[mask_kr, "거래금액"] - df_div.loc[mask_kr, "제세금합"]
+    # [1] 한글 폰트 설정 (프로세스당 한 번만 수행)
+    font_warning = configure_korean_font()
+    if font_warning:
+        st.warning(font_warning)
 
-            df_div["배당금(세후)"] = df_div["배당금(세후)"].clip(lower=0).fillna(0)
+    st.set_page_config(layout="wide") # 페이지 레이아웃을 넓게 설정
 
-            # [6] 연도/월 컬럼 생성
-            df_div["연도"] = df_div["거래일자"].dt.year
-            df_div["월"] = df_div["거래일자"].dt.month
+    st.title("💰 배당금 분석 대시보드")
+    st.markdown("엑셀 파일을 업로드하여 배당금 내역을 분석하고 시각화합니다.")
 
-            st.success("✅ 파일이 성공적으로 업로드 및 처리되었습니다!")
+    # [2] 사용자 파일 선택 -> Streamlit의 file_uploader로 변경
+    uploaded_file = st.file_uploader("배당 거래내역 엑셀 파일을 선택하세요", type=["xlsx", "xls", "csv"])
 
-            # --- 대시보드 탭 구성 ---
-            tab1, tab2, tab3, tab4 = st.tabs(["월별 배당 차트", "연도별 배당 달력", "계좌별/월별 상세", "FIRE 현황"])
+    df_div = pd.DataFrame() # 전역 변수로 df_div 선언
+    store = get_dividend_store() if STORE_ENABLED else None
+    stored_years = store.years() if store is not None else []
 
-            with tab1:
-                st.header("📈 연도별 월별 배당금 차트")
-                if not df_div.empty:
-                    monthly_data = df_div.groupby(['연도', '월'])[['배당금(세전)', '배당금(세후)']].sum().reset_index()
-                    monthly_data[['배당금(세전)', '배당금(세후)']] = monthly_data[['배당금(세전)', '배당금(세후)']].round().astype(int)
-
-                    years = sorted(monthly_data['연도'].unique(), reverse=True)
-                    
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        selected_year_chart = st.selectbox('차트 연도 선택:', years, index=0, key='chart_year_select')
-                    with col2:
-                        dividend_type_chart = st.radio('차트 금액 기준:', ['배당금(세전)', '배당금(세후)'], key='chart_type_select')
-
-                    # 12개월 템플릿 생성
-                    full_months = pd.DataFrame({'월': range(1, 13)})
-
-                    # 해당 연도 데이터 가져오고 1~12월로 merge
-                    df_plot = full_months.merge(
-                        monthly_data[monthly_data['연도'] == selected_year_chart][['월', dividend_type_chart]],
-                        on='월', how='left').fillna(0)
-
-                    # 월 이름 라벨 생성
-                    month_labels = [f"{m}월" for m in df_plot['월']]
-
-                    bars = go.Bar(
-                        x=month_labels,
-                        y=df_plot[dividend_type_chart],
-                        text=[f"{int(v):,}원" if v > 0 else "" for v in df_plot[dividend_type_chart]],
-                        textposition='outside',
-                        marker_color='orange',
-                        name=dividend_type_chart
+    if uploaded_file is not None or stored_years:
+        try:
+            ingest_cache = get_ingest_cache()
+
+            # 환율 테이블 (파일이 바뀌면 다시 읽고, 업로드 캐시 키에도 반영)
+            fx_version = os.stat(FX_RATES_PATH).st_mtime_ns if FX_RATES_PATH and os.path.exists(FX_RATES_PATH) else None
+            fx_rates = get_fx_rates(FX_RATES_PATH, fx_version) if fx_version else None
+
+            if uploaded_file is not None:
+                # [3]~[6] 파일 내용 해시 기준으로 캐시된 정규화 결과 사용 (위젯 조작 시 재파싱 방지)
+                file_bytes = uploaded_file.getvalue()
+                upload_key = IngestCache.make_key(file_bytes)
+                data_key = f"{upload_key}|fx:{fx_version}"
+                if uploaded_file.name.lower().endswith(".csv"):
+                    # CSV는 청크 단위로 읽으면서 배당 행만 정규화
+                    load = lambda: load_dividend_csv(io.BytesIO(file_bytes), chunksize=INGEST_CSV_CHUNKSIZE,
+                                                     fx_rates=fx_rates)
+                else:
+                    load = lambda: load_dividend_data(file_bytes, engine=INGEST_ENGINE, parallel=INGEST_PARALLEL,
+                                                      max_workers=INGEST_MAX_WORKERS or None, fx_rates=fx_rates)
+                with stage("load_upload") as fields:
+                    df_div, cache_hit = ingest_cache.get_or_compute(data_key, load)
+                    fields["cache"] = "hit" if cache_hit else "miss"
+
+                fx_unresolved = df_div.attrs.get("fx_unresolved_rows", 0)
+                if fx_unresolved:
+                    st.warning(
+                        f"⚠️ 환율(단가)을 찾지 못한 외화 배당 {fx_unresolved:,}건은 원화 환산 금액이 0원으로 처리되었습니다. "
+                        f"환율 테이블({FX_RATES_PATH})에 해당 통화와 날짜의 환율을 추가해주세요."
                     )
 
-                    total = df_plot[dividend_type_chart].sum()
+                # 새 업로드 내용은 저장소에 한 번만 병합 (같은 파일 재업로드 시 중복 없이 무시됨)
+                if store is not None and st.session_state.get("stored_upload_key") != upload_key:
+                    added_rows = store.upsert(df_div)
+                    st.session_state["stored_upload_key"] = upload_key
+                    st.session_state["stored_upload_added"] = added_rows
+                    stored_years = store.years()
+
+            if store is not None and stored_years:
+                # 저장소에서 선택한 연도 파티션만 읽음
+                st.sidebar.header("배당 데이터 저장소")
+                selected_store_years = st.sidebar.multiselect(
+                    '불러올 연도 (저장소):', stored_years, default=stored_years, key='store_years_select'
+                )
+                if uploaded_file is not None:
+                    st.sidebar.caption(f"이번 업로드로 새로 저장된 배당 내역: {st.session_state.get('stored_upload_added', 0):,}건")
+                data_key = "store:" + store.version(selected_store_years)
+                df_div, cache_hit = ingest_cache.get_or_compute(data_key, lambda: store.read(selected_store_years))
+
+            # 데이터셋당 한 번만 집계 큐브를 만들고 모든 탭이 이를 잘라서 사용
+            cube, _ = ingest_cache.get_or_compute("cube:" + data_key, lambda: build_dividend_cube(df_div))
+            # 모든 탭의 기본 화면을 작업자 풀에서 동시에 미리 계산 (이미 캐시에 있으면 건너뜀)
+            with stage("prefetch_views") as fields:
+                fields["computed"] = ingest_cache.prefetch(default_view_tasks(data_key, cube, df_div),
+                                                           max_workers=VIEW_PREFETCH_WORKERS)
+
+            st.sidebar.header("데이터 캐시")
+            if cache_hit:
+                st.sidebar.success("⚡ 캐시 적중: 저장된 처리 결과를 사용했습니다.")
+            else:
+                st.sidebar.warning("🔄 캐시 미스: 데이터를 새로 읽고 처리했습니다.")
+            st.sidebar.caption(
+                f"캐시 항목 {len(ingest_cache)}개 · "
+                f"{ingest_cache.used_bytes / 1024 / 1024:,.1f} / {ingest_cache.max_bytes / 1024 / 1024:,.0f} MB · "
+                f"적중 {ingest_cache.hits}회 / 미스 {ingest_cache.misses}회"
+            )
 
-                    layout = go.Layout(
-                        title=f"{selected_year_chart}년 {dividend_type_chart} (총합: {int(total):,}원)",
-                        yaxis=dict(title='금액 (원)', tickformat=","),  # 천단위 , 표시
-                        xaxis=dict(title='월', tickmode='array', tickvals=list(range(12)), ticktext=month_labels),
-                        plot_bgcolor='black',
-                        paper_bgcolor='black',
-                        font=dict(color='white'),
-                        height=500
-                    )
+            # 배당 데이터 메모리 사용량 (범주형/소형 정수 압축 전후 비교, 저장소에서 읽은 경우 압축 전 크기는 없음)
+            mem = get_memory_report(data_key, df_div)
+            if mem["rows"]:
+                caption = f"배당 데이터 {mem['rows']:,}행 · 행당 {mem['bytes_per_row']:,.0f} B"
+                if mem["bytes_per_row_uncompacted"]:
+                    saved_percent = (1 - mem["bytes_per_row"] / mem["bytes_per_row_uncompacted"]) * 100
+                    caption += f" (압축 전 {mem['bytes_per_row_uncompacted']:,.0f} B, {saved_percent:.0f}% 절감)"
+                st.sidebar.caption(caption)
 
-                    fig = go.Figure(data=[bars], layout=layout)
-                    fig.update_traces(marker_line_color='black', marker_line_width=1.5)
-                    st.plotly_chart(fig, use_container_width=True)
-                else:
-                    st.info("차트를 표시할 데이터가 없습니다.")
+            if not cube.empty:
+                with st.sidebar:
+                    render_report_export(data_key, cube)
 
-            with tab2:
-                st.header("📅 연도별 배당 달력")
-
-                # 기존: 종목별 배당 달력 (유지)
-                def create_stock_dividend_calendar(df, year, dividend_type='배당금(세후)', account_name=None):
-                    df_filtered = df[df['연도'] == year]
-                    if account_name and account_name != '전체 계좌': # '전체 계좌' 선택 시 필터링하지 않음
-                        df_filtered = df_filtered[df_filtered['계좌'] == account_name]
-
-                    df_pivot = df_filtered.pivot_table(index='종목명', columns='월', values=dividend_type, aggfunc='sum', fill_value=0)
-                    df_pivot = df_pivot.reindex(columns=range(1, 13), fill_value=0)  # 1~12월 보장
-
-                    df_pivot['총합'] = df_pivot.sum(axis=1)
-                    total_row = df_pivot.sum(axis=0).to_frame().T
-                    total_row.index = ['총합']
-                    df_final = pd.concat([df_pivot, total_row])
-                    return df_final.round(0).astype(int)
-
-                # 새로 추가: 계좌별 월별 배당 달력
-                def create_account_monthly_calendar(df, year, dividend_type='배당금(세후)', account_name=None):
-                    df_filtered = df[df['연도'] == year]
-                    if account_name and account_name != '전체 계좌':
-                        df_filtered = df_filtered[df_filtered['계좌'] == account_name]
-                    
-                    if df_filtered.empty:
-                        return pd.DataFrame()
-
-                    # '계좌'를 행으로, '월'을 열로 하는 피벗 테이블 생성
-                    df_pivot = df_filtered.groupby(['계좌', '월'])[dividend_type].sum().unstack(level='월', fill_value=0)
-                    df_pivot = df_pivot.reindex(columns=range(1, 13), fill_value=0) # 1~12월 보장
-                    
-                    df_pivot['총합'] = df_pivot.sum(axis=1) # 계좌별 총합
-                    
-                    # 전체 총합 행 추가
-                    total_row = df_pivot.sum(axis=0).to_frame().T
-                    total_row.index = ['전체 총합']
-                    df_final = pd.concat([df_pivot, total_row])
-                    
-                    return df_final.round(0).astype(int)
-
-
-                if not df_div.empty:
-                    years_calendar = sorted(df_div['연도'].unique(), reverse=True)
-                    
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        selected_year_calendar = st.selectbox('달력 연도 선택:', years_calendar, index=0, key='calendar_year_select')
-                    with col2:
-                        dividend_type_calendar = st.radio('달력 금액 기준:', ['배당금(세전)', '배당금(세후)'], key='calendar_type_select')
-                    with col3:
-                        all_accounts = ['전체 계좌'] + sorted(df_div['계좌'].unique().tolist())
-                        selected_account_calendar = st.selectbox('계좌 선택:', all_accounts, key='account_calendar_select')
-
-                    # --- 기존: 종목별 배당 달력 ---
-                    st.subheader(f"--- {selected_year_calendar}년 {selected_account_calendar} 종목별 배당 달력 ---")
-                    df_stock_calendar = create_stock_dividend_calendar(df_div, selected_year_calendar, dividend_type_calendar, selected_account_calendar)
-
-                    if df_stock_calendar.empty:
-                        st.info(f"{selected_year_calendar}년 {selected_account_calendar}에 해당하는 종목별 배당 데이터가 없습니다.")
-                    else:
-                        st.dataframe(
-                            df_stock_calendar.style.apply(lambda x: ['font-weight: bold' if x.name == '총합' else '' for i in x], axis=1)
-                            .format(lambda x: f"{x:,.0f}" if x != 0 else ""),
-                            use_container_width=True
-                        )
-                    
-                    st.markdown("---") # 구분선 추가
-
-                    # --- 새로 추가: 계좌별 월별 배당 달력 ---
-                    st.subheader(f"--- {selected_year_calendar}년 {selected_account_calendar} 계좌별 월별 배당 달력 ---")
-                    df_account_calendar = create_account_monthly_calendar(df_div, selected_year_calendar, dividend_type_calendar, selected_account_calendar)
-
-                    if df_account_calendar.empty:
-                        st.info(f"{selected_year_calendar}년 {selected_account_calendar}에 해당하는 계좌별 배당 데이터가 없습니다.")
-                    else:
-                        st.dataframe(
-                            df_account_calendar.style.apply(lambda x: ['font-weight: bold' if x.name == '전체 총합' else '' for i in x], axis=1)
-                            .format(lambda x: f"{x:,.0f}" if x != 0 else ""),
-                            use_container_width=True
-                        )
+            if uploaded_file is not None:
+                st.success("✅ 파일이 성공적으로 업로드 및 처리되었습니다!")
+            else:
+                st.success(f"✅ 저장소에서 {len(stored_years)}개 연도의 배당 데이터를 불러왔습니다. 새 파일을 업로드하면 기존 데이터에 병합됩니다.")
 
-                else:
-                    st.info("달력을 표시할 데이터가 없습니다.")
+            # --- 대시보드 탭 구성 ---
+            tab1, tab2, tab3, tab4, tab5 = st.tabs(["월별 배당 차트", "연도별 배당 달력", "계좌별/월별 상세", "FIRE 현황", "TTM 분석"])
+
+            with tab1:
+                render_chart_tab(data_key, cube)
+
+            with tab2:
+                render_calendar_tab(data_key, cube)
 
             with tab3:
-                st.header("📊 계좌별/월별 상세 배당 내역")
-
-                # get_dividend_summary_for_selection 함수: 계좌별 월별 요약 테이블 생성
-                def get_dividend_summary_for_selection(df, owner_name, account_names, selected_year, dividend_type='배당금(세후)'):
-                    if not account_names:
-                        return pd.DataFrame()
-                    df_filtered = df[(df['소유주'] == owner_name) & (df['계좌'].isin(account_names)) & (df['연도'] == selected_year)].copy()
-                    if df_filtered.empty:
-                        return pd.DataFrame()
-                    
-                    # '계좌'를 행으로, '월'을 열로 하는 피벗 테이블 생성
-                    summary = df_filtered.groupby(['계좌', '월'])[dividend_type].sum().unstack(level='월', fill_value=0)
-                    summary = summary.reindex(columns=range(1, 13), fill_value=0) # 1~12월 보장
-                    summary['총합'] = summary.sum(axis=1) # 계좌별 총합
-                    
-                    # 전체 총합 행 추가
-                    total_row = summary.sum(axis=0).to_frame().T
-                    total_row.index = ['전체 총합']
-                    df_final = pd.concat([summary, total_row])
-                    
-                    return df_final.round(0).astype(int)
-
-                def get_monthly_details_for_selection(df, owner_name, account_names, selected_year, selected_month, dividend_type='배당금(세후)'):
-                    if not account_names:
-                        return pd.DataFrame()
-                    df_filtered = df[
-                        (df['소유주'] == owner_name) &
-                        (df['계좌'].isin(account_names)) &
-                        (df['연도'] == selected_year) &
-                        (df['월'] == selected_month)
-                    ].copy()
-                    if df_filtered.empty:
-                        return pd.DataFrame()
-                    details = df_filtered[['거래일자', '계좌', '종목명', '통화코드', '배당금(세전)', '제세금합', '배당금(세후)']].sort_values(by='거래일자', ascending=False)
-                    details['거래일자'] = details['거래일자'].dt.strftime('%Y-%m-%d')
-                    total_row = pd.DataFrame({
-                        '거래일자': ['총합'], '계좌': [''], '종목명': [''], '통화코드': [''],
-                        '배당금(세전)': [details['배당금(세전)'].sum()],
-                        '제세금합': [details['제세금합'].sum()],
-                        '배당금(세후)': [details['배당금(세후)'].sum()]
-                    })
-                    details_final = pd.concat([details, total_row], ignore_index=True)
-                    return details_final.round(0).astype({col: int for col in ['배당금(세전)', '제세금합', '배당금(세후)']})
-
-
-                if not df_div.empty:
-                    if '소유주' not in df_div.columns:
-                        st.warning("⚠️ '소유주' 컬럼이 데이터에 없습니다. 엑셀 파일에 '소유주' 컬럼을 확인해주세요.")
-                        owners = []
-                    else:
-                        owners = sorted(df_div['소유주'].unique().tolist())
-
-                    years_account = sorted(df_div['연도'].unique().tolist(), reverse=True)
-                    months_account = list(range(1, 13))
-
-                    if not owners:
-                        st.info("선택할 수 있는 소유주가 없습니다.")
-                    elif not years_account:
-                        st.info("선택할 수 있는 연도가 없습니다.")
-                    else:
-                        col1, col2, col3, col4 = st.columns(4)
-                        with col1:
-                            selected_owner = st.selectbox('소유주 선택:', owners, key='owner_select')
-                        
-                        # 소유주 선택에 따라 계좌 목록 업데이트
-                        filtered_accounts = []
-                        if selected_owner:
-                            filtered_accounts = sorted(df_div[df_div['소유주'] == selected_owner]['계좌'].unique().tolist())
-                        
-                        with col2:
-                            selected_accounts = st.multiselect(
-                                '계좌 선택 (다중 선택 가능):',
-                                options=filtered_accounts,
-                                default=filtered_accounts, # 기본적으로 모든 계좌 선택
-                                key='account_select'
-                            )
-                        with col3:
-                            selected_year_account = st.selectbox('연도 선택:', years_account, key='year_account_select')
-                        with col4:
-                            selected_month_account = st.selectbox('월 선택:', months_account, key='month_account_select')
-                        
-                        dividend_type_account = st.radio('금액 기준:', ['배당금(세전)', '배당금(세후)'], key='type_account_select')
-
-                        if selected_owner and selected_accounts and selected_year_account: # 월 선택은 상세에만 영향
-                            # 이 부분이 '계좌별 월별 요약' 테이블입니다.
-                            st.subheader(f"--- 소유주: {selected_owner}, 연도: {selected_year_account} - 선택 계좌별 월별 {dividend_type_account} 요약 ---")
-                            summary_df = get_dividend_summary_for_selection(df_div, selected_owner, selected_accounts, selected_year_account, dividend_type_account)
-                            if summary_df.empty:
-                                st.info("선택된 소유주, 계좌 및 연도에 배당 내역이 없습니다.")
-                            else:
-                                st.dataframe(
-                                    summary_df.style.apply(lambda x: ['font-weight: bold' if x.name == '전체 총합' else '' for i in x], axis=1)
-                                    .format(lambda x: f"{x:,.0f}" if x != 0 else ""),
-                                    use_container_width=True
-                                )
-                                
-                            # 이 부분이 '상세 내역' 테이블입니다.
-                            st.subheader(f"\n--- 소유주: {selected_owner}, 계좌: {', '.join(selected_accounts)}, 연도: {selected_year_account}년 {selected_month_account}월 - {dividend_type_account} 상세 내역 ---")
-                            details_df = get_monthly_details_for_selection(df_div, selected_owner, selected_accounts, selected_year_account, selected_month_account, dividend_type_account)
-                            if details_df.empty:
-                                st.info(f"선택된 소유주, 계좌, {selected_year_account}년 {selected_month_account}월에 배당 내역이 없습니다.")
-                            else:
-                                st.dataframe(
-                                    details_df.style.apply(lambda x: ['font-weight: bold' if x.거래일자 == '총합' else '' for i in x], axis=1)
-                                    .format({
-                                    '배당금(세전)': '{:,.0f}',
-                                    '제세금합': '{:,.0f}',
-                                    '배당금(세후)': '{:,.0f}'
-                                    }),
-                                    use_container_width=True
-                                )
-                        else:
-                            st.info("소유주, 하나 이상의 계좌, 연도, 그리고 월을 선택해주세요.")
-                else:
-                    st.info("상세 내역을 표시할 데이터가 없습니다.")
+                render_detail_tab(data_key, cube, df_div)
 
             with tab4:
-                st.header("🔥 FIRE 현황 분석")
-                # 사용자 지정 FIRE 전략 정보 반영
-                st.markdown(f"**목표 월 생활비:** {4_000_000:,.0f}원")
-                st.markdown("**FIRE 전략:** 배당금으로 생활, 월 400만원 생활비 목표, 배당 성장을 통한 인플레이션 극복")
-
-                if not df_div.empty:
-                    current_year = df_div['연도'].max()
-                    current_year_div = df_div[df_div['연도'] == current_year]['배당금(세후)'].sum()
-                    
-                    # 월별 목표 계산 (사용자 정보 반영)
-                    monthly_fire_goal = 4_000_000 # 사용자 정보에서 가져옴: 월 생활비 4백만원
-                    annual_fire_goal = monthly_fire_goal * 12
-
-                    st.subheader(f"{current_year}년 FIRE 목표 달성 현황")
-                    st.write(f"현재까지 {current_year}년 총 세후 배당금: **{int(current_year_div):,}원**")
-                    st.write(f"연간 FIRE 목표 금액: **{annual_fire_goal:,.0f}원**")
-
-                    progress_percent = (current_year_div / annual_fire_goal) * 100 if annual_fire_goal > 0 else 0
-                    st.progress(min(float(progress_percent / 100), 1.0), text=f"목표 달성률: **{progress_percent:.2f}%**")
-
-                    if current_year_div >= annual_fire_goal:
-                        st.success("🎉 축하합니다! 올해 FIRE 목표를 달성했습니다!")
-                    elif current_year_div > 0:
-                        st.info(f"올해 목표까지 **{int(annual_fire_goal - current_year_div):,}원**이 부족합니다.")
-                    else:
-                        st.info("아직 올해 배당금이 없습니다. 목표 달성을 위해 노력해봅시다!")
-                    
-                    st.subheader("인플레이션 극복을 위한 배당 성장률")
-                    
-                    # 연도별 배당금 합계 계산
-                    annual_dividends = df_div.groupby('연도')['배당금(세후)'].sum().reset_index()
-                    
-                    if len(annual_dividends) < 2:
-                        st.info("배당 성장률을 계산하기 위한 충분한 연도별 데이터(최소 2년)가 필요합니다.")
-                    else:
-                        # 전년 대비 배당 성장률 계산
-                        annual_dividends['전년도_배당금'] = annual_dividends['배당금(세후)'].shift(1)
-                        # 0으로 나누는 오류 방지
-                        annual_dividends['성장률'] = annual_dividends.apply(
-                            lambda row: ((row['배당금(세후)'] - row['전년도_배당금']) / row['전년도_배당금']) * 100
-                            if row['전년도_배당금'] != 0 else np.nan, axis=1
-                        )
-                        
-                        st.dataframe(annual_dividends.round(2).fillna(0).style.format({
-                            '배당금(세전)': '{:,.0f}',
-                            '전년도_배당금': '{:,.0f}',
-                            '성장률': '{:,.2f}%'
-                        }), use_container_width=True)
-
-                        st.info("⚠️ **참고:** FIRE 전략에는 '배당 성장을 통한 인플레이션 극복'이 포함되어 있습니다. 위에 표시된 성장률이 물가 상승률보다 높은지 주기적으로 확인하는 것이 중요합니다. 한국의 물가 상승률(CPI) 데이터를 직접 비교하는 기능은 추후 추가할 수 있습니다.")
-                else:
-                    st.info("FIRE 현황을 분석할 데이터가 없습니다.")
+                render_fire_tab(data_key, cube)
 
+            with tab5:
+                render_ttm_tab(data_key, cube)
 
         except Exception as e:
-            st.error(f"❌ 파일을 처리하는 중 오류가 발생했습니다. 엑셀 파일 형식 및 내용(특히 시트 이름이 연도인지, 필요한 컬럼들이 있는지)을 확인해주세요: {e}")
-            st.info("예상되는 엑셀 컬럼: '거래일자', '거래종류', '종목명', '거래금액', '외화거래금액', '제세금합', '단가', '통화코드', '소유주' 그리고 시트명은 '2024', '2025'와 같은 연도여야 합니다.")
+            show_processing_error(e)
     else:
         st.info("왼쪽 사이드바에서 엑셀 파일을 업로드하여 시작하세요.")
 
     st.sidebar.header("앱 정보")
     st.sidebar.info("이 앱은 개인 배당금 내역을 분석하고 FIRE(Financial Independence, Retire Early) 전략 달성 현황을 시각화합니다.")
 
+    # 시작 시간 측정: 프로세스 첫 렌더(콜드 스타트)와 이번 실행의 렌더 시간
+    render_seconds = time.perf_counter() - _SCRIPT_START
+    startup_metrics = get_startup_metrics()
+    if "first_render_s" not in startup_metrics:
+        startup_metrics.update({
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "version": __version__,
+            "pid": os.getpid(),
+            "first_render_s": round(render_seconds, 4),
+        })
+        if STARTUP_LOG_PATH:
+            try:
+                append_jsonl(STARTUP_LOG_PATH, startup_metrics)
+            except OSError:
+                pass # 기록 실패는 대시보드 사용에 영향을 주지 않음
+    st.sidebar.caption(
+        f"v{__version__} · 시작 시 import {startup_metrics['import_s']:.2f}초 · "
+        f"첫 렌더 {startup_metrics['first_render_s']:.2f}초 · 이번 실행 {render_seconds:.2f}초"
+    )
+
     
+
+    # 단계별 성능 측정 결과 (디버그)
+    with st.sidebar.expander("🔧 단계별 성능 측정", expanded=profiler is not None):
+        st.checkbox('단계별 시간/메모리 측정', value=PROFILE_DEFAULT, key='profile_toggle',
+                    help=f"측정 결과는 {PROFILE_LOG_PATH or '(기록 안 함)'}에 JSON Lines로 누적 기록됩니다. 측정 중에는 메모리 추적 때문에 다소 느려집니다.")
+        if profiler is not None:
+            profiler.stop()
+            write_profile_log(profiler, "run")
+            if profiler.records:
+                st.dataframe(profile_table(profiler.records), hide_index=True, use_container_width=True)
+                st.caption("탭 위젯만 바꾼 경우(탭 단독 재실행)의 측정은 로그 파일에만 기록됩니다.")
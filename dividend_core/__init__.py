@@ -0,0 +1,44 @@
+"""Headless dividend pipeline shared by the Streamlit dashboard and the batch CLI."""
+
+__version__ = "0.2.0"
+
+from .cache import IngestCache
+from .display import amount_table, bold_rows, page_count, paginate
+from .export import iter_report_sheets, report_sheet_tasks, write_report_workbook
+from .fire import (
+    dividend_baseline,
+    estimate_dividend_growth,
+    estimate_inflation,
+    load_cpi,
+    simulate_fire,
+    summarize_fire,
+)
+from .fx import FX_COLUMNS, convert_to_krw, load_fx_rates, lookup_fx_rates
+from .metrics import StageProfiler, active_profiler, append_jsonl, profile_call, stage
+from .pipeline import (
+    CATEGORICAL_COLUMNS,
+    COMPACT_COLUMNS,
+    CUBE_DIMENSIONS,
+    CUBE_MEASURES,
+    DIV_KEYWORDS,
+    build_dividend_cube,
+    compact_dividends,
+    load_dividend_csv,
+    load_dividend_data,
+    memory_report,
+    normalize_dividends,
+    slice_cube,
+)
+from .reader import USED_COLUMNS, detect_csv_encoding, iter_csv_chunks, read_workbook, resolve_engine
+from .reports import (
+    create_account_monthly_calendar,
+    create_stock_dividend_calendar,
+    get_annual_dividend_growth,
+    get_annual_dividends,
+    get_dividend_summary_for_selection,
+    get_monthly_details_for_selection,
+    get_monthly_totals,
+    get_year_month_matrix,
+)
+from .store import STORE_KEY_COLUMNS, DividendStore
+from .ttm import TTM_MONTHS, build_ttm_panel, ttm_snapshot, ttm_totals
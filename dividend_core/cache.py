@@ -0,0 +1,99 @@
+import contextvars
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+
+def _nbytes(value):
+    """Approximate in-memory size of a cached value (frames, arrays and containers of them)."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sum(_nbytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(_nbytes(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class IngestCache:
+    """LRU cache of normalized dividend frames keyed by a SHA-256 hash of the uploaded bytes.
+
+    Values derived from a cached frame (the aggregation cube, per-tab views) can be stored under
+    any other key with `get_or_compute`. Entries are evicted least-recently-used first once their total in-memory size exceeds
+    `max_bytes`. Cached frames are shared between sessions, so callers must not mutate them.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (value, nbytes)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(file_bytes):
+        return hashlib.sha256(file_bytes).hexdigest()
+
+    @property
+    def used_bytes(self):
+        with self._lock:
+            return sum(nbytes for _, nbytes in self._entries.values())
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def get_or_load(self, file_bytes, loader):
+        """Returns `(df, hit)`; calls `loader(file_bytes)` only when the content is not cached."""
+        return self.get_or_compute(self.make_key(file_bytes), lambda: loader(file_bytes))
+
+    def get_or_compute(self, key, compute):
+        """Returns `(value, hit)` for an arbitrary cache key; calls `compute()` on a miss."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0], True
+            self.misses += 1
+
+        # 파싱은 잠금 밖에서 수행하여 다른 세션의 캐시 조회를 막지 않음
+        value = compute()
+        nbytes = _nbytes(value)
+
+        with self._lock:
+            self._entries[key] = (value, nbytes)
+            self._entries.move_to_end(key)
+            total = sum(n for _, n in self._entries.values())
+            # 방금 넣은 항목은 예산을 넘더라도 유지 (그래야 다음 rerun에서 적중)
+            while total > self.max_bytes and len(self._entries) > 1:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                total -= evicted
+        return value, False
+
+    def prefetch(self, computations, max_workers=None):
+        """Computes the missing entries of `{key: compute}` concurrently in a thread pool.
+
+        Returns the number of entries computed. A failing computation is not cached, so its error
+        surfaces where the value is later requested with `get_or_compute`.
+        """
+        with self._lock:
+            missing = {key: compute for key, compute in computations.items() if key not in self._entries}
+        if not missing:
+            return 0
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            # 호출한 쪽의 컨텍스트(측정 중인 StageProfiler 등)를 작업자 스레드에도 전달
+            futures = [
+                pool.submit(contextvars.copy_context().run, self.get_or_compute, key, compute)
+                for key, compute in missing.items()
+            ]
+        return sum(future.exception() is None for future in futures)
@@ -0,0 +1,114 @@
+"""Batch CLI: computes the dashboard calendars and summaries for a directory of workbooks.
+
+Usage:
+    python -m dividend_core <input_dir> <output_dir> [--workers N] [--dividend-type 배당금(세후)] [--excel]
+
+For each workbook `<name>.xlsx` (or CSV export `<name>.csv`) the results are written as CSV files under `<output_dir>/<name>/`.
+With `--excel` the bulk multi-sheet report is also written to `<output_dir>/<name>/report.xlsx`.
+"""
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .export import write_report_workbook
+from .fx import load_fx_rates
+from .pipeline import build_dividend_cube, load_dividend_csv, load_dividend_data, slice_cube
+from .reports import (
+    create_account_monthly_calendar,
+    create_stock_dividend_calendar,
+    get_annual_dividend_growth,
+    get_dividend_summary_for_selection,
+    get_monthly_totals,
+)
+
+WORKBOOK_EXTENSIONS = (".xlsx", ".xls", ".csv")
+
+
+def _write_csv(df, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    df.to_csv(path, encoding="utf-8-sig")  # 엑셀에서 한글이 깨지지 않도록 BOM 포함
+
+
+def process_workbook(path, output_dir, dividend_type="배당금(세후)", engine="auto", fx_rates_path=None, excel=False):
+    """Computes every calendar/summary for one workbook and writes them under `output_dir`.
+
+    Returns the number of dividend rows processed.
+    """
+    fx_rates = load_fx_rates(fx_rates_path) if fx_rates_path else None
+    if path.lower().endswith(".csv"):
+        # CSV는 파일 전체를 읽지 않고 청크 단위로 배당 행만 추림
+        df_div = load_dividend_csv(path, fx_rates=fx_rates)
+    else:
+        with open(path, "rb") as f:
+            file_bytes = f.read()
+        # 워크북 단위로 이미 병렬 처리하므로 시트 단위 프로세스 풀은 사용하지 않음
+        df_div = load_dividend_data(file_bytes, engine=engine, parallel=False, fx_rates=fx_rates)
+    cube = build_dividend_cube(df_div)
+
+    name = os.path.splitext(os.path.basename(path))[0]
+    out = os.path.join(output_dir, name)
+    if cube.empty:
+        os.makedirs(out, exist_ok=True)
+        return 0
+
+    _write_csv(get_monthly_totals(cube).set_index(['연도', '월']), os.path.join(out, "monthly_totals.csv"))
+    _write_csv(get_annual_dividend_growth(cube).set_index('연도'), os.path.join(out, "annual_growth.csv"))
+
+    for year in sorted(cube.index.unique(level='연도').dropna()):
+        year_dir = os.path.join(out, str(int(year)))
+        _write_csv(create_stock_dividend_calendar(cube, year, dividend_type), os.path.join(year_dir, "stock_calendar.csv"))
+        _write_csv(create_account_monthly_calendar(cube, year, dividend_type), os.path.join(year_dir, "account_calendar.csv"))
+        if '소유주' in cube.index.names:
+            for owner in cube.index.unique(level='소유주').dropna():
+                accounts = slice_cube(cube, 소유주=owner).index.unique(level='계좌').dropna().tolist()
+                summary = get_dividend_summary_for_selection(cube, owner, accounts, year, dividend_type)
+                if not summary.empty:
+                    _write_csv(summary, os.path.join(year_dir, f"summary_{owner}.csv"))
+
+    if excel:
+        # 워크북 단위로 이미 병렬 처리하므로 시트 계산도 작업자 하나로 수행
+        write_report_workbook(cube, os.path.join(out, "report.xlsx"), dividend_type, max_workers=1)
+    return len(df_div)
+
+
+def find_workbooks(input_dir):
+    return sorted(
+        os.path.join(input_dir, name) for name in os.listdir(input_dir)
+        if name.lower().endswith(WORKBOOK_EXTENSIONS) and not name.startswith("~$")
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m dividend_core", description="배당 거래내역 엑셀 파일 일괄 처리")
+    parser.add_argument("input_dir", help="엑셀 파일(.xlsx/.xls) 또는 CSV 파일이 있는 디렉터리")
+    parser.add_argument("output_dir", help="결과 CSV를 저장할 디렉터리")
+    parser.add_argument("--workers", type=int, default=0, help="동시에 처리할 파일 수 (0이면 CPU 코어 수)")
+    parser.add_argument("--dividend-type", default="배당금(세후)", choices=["배당금(세전)", "배당금(세후)"])
+    parser.add_argument("--engine", default="auto", help="엑셀 리더 엔진 (auto/calamine/openpyxl)")
+    parser.add_argument("--excel", action="store_true", help="연도 × 소유주 × 계좌별 시트를 담은 엑셀 보고서(report.xlsx)도 저장")
+    parser.add_argument("--fx-rates", help="단가가 없는 외화 배당 환산에 사용할 환율 CSV (날짜, 통화코드, 환율)")
+    args = parser.parse_args(argv)
+
+    paths = find_workbooks(args.input_dir)
+    if not paths:
+        print(f"처리할 엑셀 파일이 없습니다: {args.input_dir}", file=sys.stderr)
+        return 1
+
+    failures = 0
+    workers = min(len(paths), args.workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(process_workbook, path, args.output_dir, args.dividend_type, args.engine, args.fx_rates,
+                        args.excel): path
+            for path in paths
+        }
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                rows = future.result()
+                print(f"✅ {os.path.basename(path)}: 배당 내역 {rows:,}건 처리")
+            except Exception as e:
+                failures += 1
+                print(f"❌ {os.path.basename(path)}: {e}", file=sys.stderr)
+    return 1 if failures else 0
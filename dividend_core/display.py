@@ -0,0 +1,52 @@
+import math
+
+import pandas as pd
+
+BOLD = {'font-weight': 'bold'}
+
+
+def amount_table(df, columns=None, blank_zero=True):
+    """Returns a display copy of `df` whose amount columns stay numeric, rounded to whole won.
+
+    `columns` defaults to every numeric column. With `blank_zero` zeros become missing values so the
+    table shows blank cells. Thousands separators are left to `bold_rows`, so amounts still
+    right-align and sort as numbers. Column labels become strings (e.g. the month numbers 1~12).
+    """
+    table = df.copy()
+    if columns is None:
+        columns = table.select_dtypes(include='number').columns
+    columns = list(columns)
+    amounts = table[columns].round(0)
+    if blank_zero:
+        amounts = amounts.mask(amounts == 0)
+    table[columns] = amounts
+    table.columns = table.columns.map(str)
+    return table
+
+
+def bold_rows(table, rows, amount_columns=(), formats=None):
+    """Returns a Styler that bolds the rows whose index label is in `rows` (one style rule, no per-cell callback).
+
+    `amount_columns` are shown with thousands separators and `formats` maps other columns to a format
+    string (e.g. `'{:.2f}%'`); missing values show as blank cells. Only the display text is formatted,
+    so the values stay numeric and the columns still sort as numbers.
+    """
+    rows = [label for label in rows if label in table.index]
+    styler = table.style.format(precision=0, thousands=',', na_rep='', subset=list(amount_columns))
+    for col, fmt in (formats or {}).items():
+        styler = styler.format(fmt, na_rep='', subset=[col])
+    if rows:
+        styler = styler.set_properties(subset=pd.IndexSlice[rows, :], **BOLD)
+    return styler
+
+
+def page_count(n_rows, page_size):
+    """Number of pages needed to show `n_rows` rows `page_size` at a time (at least 1)."""
+    return max(1, math.ceil(n_rows / page_size))
+
+
+def paginate(df, page, page_size, keep_last=False):
+    """Returns rows of 1-based `page`; with `keep_last` the final (총합) row is shown on every page."""
+    body, tail = (df.iloc[:-1], df.iloc[-1:]) if keep_last else (df, df.iloc[:0])
+    start = (page - 1) * page_size
+    return pd.concat([body.iloc[start:start + page_size], tail])
@@ -0,0 +1,176 @@
+import contextvars
+import os
+import re
+from collections import deque
+from numbers import Number
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from .metrics import stage
+from .pipeline import CUBE_MEASURES, slice_cube
+from .reports import (
+    create_account_monthly_calendar,
+    create_stock_dividend_calendar,
+    get_annual_dividend_growth,
+    get_dividend_summary_for_selection,
+)
+
+SHEET_NAME_MAX = 31  # 엑셀 시트 이름 최대 길이
+TOTAL_ROW_LABELS = ('총합', '전체 총합')
+PERCENT_COLUMNS = ('성장률',)
+AMOUNT_COLUMNS = ('총합', '전년도_배당금', *CUBE_MEASURES)  # 월 열(1~12)도 금액 열
+_INVALID_SHEET_CHARS = re.compile(r'[\[\]:*?/\\]')
+
+
+def _sheet_name(title, used):
+    """Returns a valid, unique Excel sheet name for `title` and records it in `used`."""
+    base = _INVALID_SHEET_CHARS.sub('_', str(title)).strip("'")[:SHEET_NAME_MAX] or 'Sheet'
+    name, n = base, 2
+    while name.lower() in used:
+        suffix = f" ({n})"
+        name, n = base[:SHEET_NAME_MAX - len(suffix)] + suffix, n + 1
+    used.add(name.lower())
+    return name
+
+
+def report_sheet_tasks(cube, dividend_type='배당금(세후)'):
+    """Lists the sheets of the bulk report as `(title, compute, index_label)` in workbook order.
+
+    - 연도별 성장률: the tab4 annual after-tax growth table
+    - per 연도: the stock calendar and the account calendar of every account
+    - per 연도 × 소유주: the account summary of all of the owner's accounts
+    - per 연도 × 소유주 × 계좌: the stock calendar of that account
+
+    Only combinations that have dividends are listed. `compute` is called without arguments;
+    `index_label` heads the row-label column (None for frames written without their index).
+    """
+    if cube.empty:
+        return []
+    tasks = [('연도별 성장률', lambda: get_annual_dividend_growth(cube), None)]
+    index = cube.index
+    has_owner = '소유주' in index.names
+    combos = index.droplevel([lvl for lvl in index.names if lvl not in ('소유주', '계좌', '연도')]).unique()
+    combos = combos.to_frame(index=False).dropna().sort_values(['연도', *(['소유주'] if has_owner else []), '계좌'])
+
+    for year, by_year in combos.groupby('연도', sort=False, observed=True):
+        year = int(year)
+        # 시트마다 전체 큐브를 훑지 않도록 연도/소유주 단위로 한 번만 잘라서 사용
+        year_cube = slice_cube(cube, 연도=year)
+        tasks += [
+            (f"{year} 종목별", lambda c=year_cube, y=year: create_stock_dividend_calendar(c, y, dividend_type), '종목명'),
+            (f"{year} 계좌별", lambda c=year_cube, y=year: create_account_monthly_calendar(c, y, dividend_type), '계좌'),
+        ]
+        if not has_owner:
+            continue
+        for owner, by_owner in by_year.groupby('소유주', sort=False, observed=True):
+            accounts = by_owner['계좌'].tolist()
+            # 같은 이름의 계좌가 여러 소유주에게 있을 수 있으므로 소유주로 먼저 자름
+            owner_cube = slice_cube(year_cube, 소유주=owner)
+            tasks.append((f"{year} {owner}",
+                          lambda c=owner_cube, y=year, o=owner, a=accounts:
+                              get_dividend_summary_for_selection(c, o, a, y, dividend_type),
+                          '계좌'))
+            tasks += [
+                (f"{year} {owner} {account}",
+                 lambda c=owner_cube, y=year, a=account: create_stock_dividend_calendar(c, y, dividend_type, a),
+                 '종목명')
+                for account in accounts
+            ]
+    return tasks
+
+
+def iter_report_sheets(cube, dividend_type='배당금(세후)', max_workers=None):
+    """Yields `(sheet_name, frame, index_label)` in workbook order, computing the frames in a thread pool.
+
+    At most twice `max_workers` frames are computed ahead of the consumer, so memory stays bounded
+    by the pool size rather than the number of sheets.
+    """
+    workers = max_workers or min(8, os.cpu_count() or 1)
+    used = set()
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for title, compute, index_label in report_sheet_tasks(cube, dividend_type):
+            # 측정 중인 StageProfiler 등 호출한 쪽의 컨텍스트를 작업자 스레드에도 전달
+            future = pool.submit(contextvars.copy_context().run, compute)
+            pending.append((_sheet_name(title, used), future, index_label))
+            if len(pending) >= workers * 2:
+                name, future, index_label = pending.popleft()
+                yield name, future.result(), index_label
+        while pending:
+            name, future, index_label = pending.popleft()
+            yield name, future.result(), index_label
+
+
+def _is_amount_column(col):
+    return isinstance(col, Number) or col in AMOUNT_COLUMNS
+
+
+def _write_frame(wb, name, df, index_label=None):
+    """Appends `df` as a new write-only sheet: a header row, then one row per record (totals in bold).
+
+    With `index_label` the index is written as the first column under that header. Amount columns
+    get a thousands format, `PERCENT_COLUMNS` a percent format and other columns (연도) stay General.
+    Missing values are left as empty cells; zeros are too in the amount columns of calendars (frames
+    written with their index), as in the dashboard tables.
+    """
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+
+    ws = wb.create_sheet(title=name)
+    bold = Font(bold=True)
+    write_index = index_label is not None
+    ws.column_dimensions['A'].width = 18  # 행 이름(종목명/계좌) 열
+
+    header = [WriteOnlyCell(ws, value=str(col)) for col in [*([index_label] if write_index else []), *df.columns]]
+    for cell in header:
+        cell.font = bold
+    ws.append(header)
+
+    formats = ['0.00"%"' if col in PERCENT_COLUMNS else '#,##0' if _is_amount_column(col) else None
+               for col in df.columns]
+    blank_zero = [write_index and _is_amount_column(col) for col in df.columns]
+    for label, values in zip(df.index, df.itertuples(index=False, name=None)):
+        is_total = write_index and label in TOTAL_ROW_LABELS
+        row = []
+        if write_index:
+            cell = WriteOnlyCell(ws, value=label)
+            if is_total:
+                cell.font = bold
+            row.append(cell)
+        for value, number_format, blank in zip(values, formats, blank_zero):
+            if pd.isna(value) or (blank and isinstance(value, Number) and value == 0):
+                row.append(None)  # 빈 칸 (달력의 대부분을 차지하는 0은 셀을 만들지 않아 쓰기 시간이 줄어듦)
+                continue
+            if hasattr(value, 'item'):
+                value = value.item()  # numpy 스칼라를 파이썬 값으로
+            cell = WriteOnlyCell(ws, value=value)
+            if number_format and isinstance(value, Number):
+                cell.number_format = number_format
+            if is_total:
+                cell.font = bold
+            row.append(cell)
+        ws.append(row)
+
+
+def write_report_workbook(cube, target, dividend_type='배당금(세후)', max_workers=None):
+    """Writes the bulk report (see `report_sheet_tasks`) to `target`, a path or binary file object.
+
+    The workbook is written with openpyxl's write-only mode, which streams each sheet's rows to a
+    temporary file instead of keeping a cell grid per sheet. Returns the number of sheets written.
+    """
+    from openpyxl import Workbook  # 내보내기를 할 때만 openpyxl을 불러옴
+
+    wb = Workbook(write_only=True)
+    count = 0
+    with stage("export_report") as fields:
+        for name, df, index_label in iter_report_sheets(cube, dividend_type, max_workers):
+            if df.empty:
+                continue
+            _write_frame(wb, name, df, index_label)
+            count += 1
+        if count == 0:
+            wb.create_sheet(title='배당 내역 없음')  # 시트가 하나도 없는 통합 문서는 저장할 수 없음
+        wb.save(target)
+        fields["sheets"] = count
+    return count
@@ -0,0 +1,125 @@
+import numpy as np
+import pandas as pd
+
+from .reports import get_annual_dividends
+
+# 과거 데이터로 추정할 수 없을 때 사용하는 기본 가정 (연 로그 성장률/물가 상승률의 평균, 표준편차)
+DEFAULT_GROWTH = (0.05, 0.10)
+DEFAULT_INFLATION = (0.025, 0.01)
+
+
+def load_cpi(path):
+    """Loads a CPI table (CSV with 연도, CPI index level) as a Series indexed by 연도."""
+    cpi = pd.read_csv(path, usecols=['연도', 'CPI'])
+    return cpi.dropna().astype({'연도': int}).set_index('연도')['CPI'].sort_index()
+
+
+def _log_growth_stats(series, default):
+    """Mean and std of year-over-year log growth of a positive annual series."""
+    series = series[series > 0].sort_index()
+    # 연속된 연도 사이의 성장률만 사용
+    consecutive = np.diff(series.index.to_numpy()) == 1
+    growth = np.diff(np.log(series.to_numpy(dtype=float)))[consecutive]
+    if len(growth) == 0:
+        return default
+    if len(growth) == 1:
+        return float(growth[0]), default[1]
+    return float(growth.mean()), float(growth.std(ddof=1))
+
+
+def _partial_years(months_paid):
+    """Returns the first and latest years that paid in fewer months than a typical year.
+
+    `months_paid` is the number of months with dividends per 연도. The typical year is the median of
+    the years in between (of both years when there are only two), so a history that starts or stops
+    mid-year is detected while a payer whose schedule never includes January or December (e.g.
+    quarterly in 3/6/9/12월) keeps its full years.
+    """
+    if len(months_paid) < 2:
+        return []
+    reference = months_paid.iloc[1:-1] if len(months_paid) > 2 else months_paid
+    typical = reference.median()
+    return [year for year in (months_paid.index[0], months_paid.index[-1]) if months_paid[year] < typical]
+
+
+def dividend_baseline(cube):
+    """Returns `(base_year, ttm_dividends, complete_years)` for the projection.
+
+    `ttm_dividends` is the after-tax total of the trailing 12 months ending at the latest month
+    with data, and `complete_years` is the annual after-tax series without a partial first or
+    latest year (a history starting mid-year would otherwise look like strong growth).
+    """
+    monthly = cube.groupby(level=['연도', '월'], observed=True)['배당금(세후)'].sum()
+    years = monthly.index.get_level_values('연도').astype(int)
+    period = years * 12 + monthly.index.get_level_values('월').astype(int)
+    latest = int(period.max())
+    ttm = float(monthly[period > latest - 12].sum())
+    base_year = (latest - 1) // 12
+
+    annual = get_annual_dividends(cube)
+    months_paid = pd.Series(1, index=years).groupby(level=0).sum()
+    complete_years = annual.drop(_partial_years(months_paid), errors='ignore')
+    return base_year, ttm, complete_years
+
+
+def estimate_dividend_growth(annual_dividends):
+    """Returns `(mu, sigma)` of annual log dividend growth estimated from complete years."""
+    return _log_growth_stats(annual_dividends, DEFAULT_GROWTH)
+
+
+def estimate_inflation(cpi):
+    """Returns `(mu, sigma)` of annual log inflation from a CPI series (defaults when unavailable)."""
+    if cpi is None or len(cpi) < 2:
+        return DEFAULT_INFLATION
+    return _log_growth_stats(cpi, DEFAULT_INFLATION)
+
+
+def simulate_fire(current_annual, monthly_goal, growth=DEFAULT_GROWTH, inflation=DEFAULT_INFLATION,
+                  monthly_contribution=0.0, dividend_yield=0.035, horizon=40, paths=20_000, seed=0):
+    """Monte Carlo projection of the year the after-tax dividends cover the monthly goal.
+
+    Each path draws yearly log growth of existing dividends ~ N(growth) and log inflation
+    ~ N(inflation). Yearly contributions (`monthly_contribution` × 12) add
+    `contribution × dividend_yield` of new annual dividends. The goal is inflated along each
+    path. With D_k = D_{k-1}·e^{g_k} + a, the whole path is D_k = P_k·(D_0 + a·Σ_{j≤k} 1/P_j) with
+    P_k = e^{g_1+…+g_k}, so every path and year is computed with cumulative sums and no Python loop.
+
+    Returns `years_to_goal`: an array of length `paths` with the number of years (1…horizon) until
+    the goal is met, or NaN when it is not met within `horizon`.
+    """
+    rng = np.random.default_rng(seed)
+    g = rng.normal(growth[0], growth[1], size=(paths, horizon))
+    pi = rng.normal(inflation[0], inflation[1], size=(paths, horizon))
+
+    growth_factor = np.exp(np.cumsum(g, axis=1))  # P_k
+    added = monthly_contribution * 12 * dividend_yield  # 해마다 추가되는 연 배당금
+    dividends = growth_factor * (current_annual + added * np.cumsum(1.0 / growth_factor, axis=1))
+    goal = monthly_goal * 12 * np.exp(np.cumsum(pi, axis=1))
+
+    met = dividends >= goal
+    years_to_goal = met.argmax(axis=1).astype(float) + 1
+    years_to_goal[~met.any(axis=1)] = np.nan
+    return years_to_goal
+
+
+def summarize_fire(years_to_goal, base_year):
+    """Summarizes simulated years-to-goal into percentiles and a per-year probability table."""
+    met = years_to_goal[~np.isnan(years_to_goal)]
+    summary = {
+        "probability": len(met) / len(years_to_goal) if len(years_to_goal) else 0.0,
+        "percentiles": {},
+    }
+    # 달성하지 못한 경로는 무한대로 보고 분위수를 계산 (해당 분위가 기간 내 미달성이면 None)
+    filled = np.where(np.isnan(years_to_goal), np.inf, years_to_goal)
+    for q in (10, 50, 90):
+        value = np.percentile(filled, q, method='higher') if len(filled) else np.inf
+        summary["percentiles"][q] = int(base_year + value) if np.isfinite(value) else None
+
+    counts = pd.Series(met + base_year).astype(int).value_counts().sort_index()
+    distribution = pd.DataFrame({
+        '연도': counts.index,
+        '확률': counts.to_numpy() / len(years_to_goal),
+    })
+    distribution['누적확률'] = distribution['확률'].cumsum()
+    summary["distribution"] = distribution
+    return summary
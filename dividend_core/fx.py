@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+
+# 환율 테이블 컬럼: 날짜, 통화코드, 환율 (외화 1단위당 원화)
+FX_COLUMNS = ['날짜', '통화코드', '환율']
+
+
+def load_fx_rates(path):
+    """Loads a dated FX table (CSV with 날짜, 통화코드, 환율 = KRW per unit) sorted by 날짜."""
+    fx = pd.read_csv(path, usecols=FX_COLUMNS)
+    fx['날짜'] = pd.to_datetime(fx['날짜']).astype('datetime64[ns]')
+    fx['통화코드'] = fx['통화코드'].astype(str).str.strip().str.upper()
+    fx['환율'] = pd.to_numeric(fx['환율'], errors='coerce')
+    return fx.dropna().sort_values('날짜', ignore_index=True)
+
+
+def lookup_fx_rates(dates, currencies, fx_rates):
+    """Returns, for each (date, currency), the latest rate dated on or before it (NaN if none).
+
+    Implemented as a single as-of join per call, so the cost does not grow with the number
+    of currencies.
+    """
+    left = pd.DataFrame({
+        '거래일자': pd.to_datetime(dates).astype('datetime64[ns]'),
+        '통화코드': np.asarray(currencies, dtype=object),
+        '_pos': np.arange(len(dates)),
+    }).dropna(subset=['거래일자']).sort_values('거래일자')
+    rates = np.full(len(dates), np.nan)
+    if left.empty or fx_rates is None or fx_rates.empty:
+        return rates
+    fx_rates = fx_rates.astype({'날짜': 'datetime64[ns]'})
+    if not fx_rates['날짜'].is_monotonic_increasing:
+        fx_rates = fx_rates.sort_values('날짜')
+    merged = pd.merge_asof(left, fx_rates, left_on='거래일자', right_on='날짜', by='통화코드', direction='backward')
+    rates[merged['_pos'].to_numpy()] = merged['환율'].to_numpy()
+    return rates
+
+
+def convert_to_krw(df, fx_rates=None):
+    """Converts every dividend row to KRW in one vectorized pass over all currencies.
+
+    Foreign rows (통화코드 other than KRW with a 외화거래금액) use the row's 단가 as the rate; when
+    단가 is missing the rate is looked up in `fx_rates` by nearest prior date. KRW rows use
+    거래금액 directly. Returns `(before_tax, after_tax, unresolved)` arrays, where `unresolved`
+    marks foreign rows for which no rate could be found (their amounts are NaN).
+    """
+    currency = df['통화코드'].to_numpy(dtype=object)
+    foreign_amount = df['외화거래금액'].to_numpy(dtype=float)
+    foreign = (currency != 'KRW') & ~np.isnan(foreign_amount)
+
+    rate = df['단가'].to_numpy(dtype=float).copy()
+    need_lookup = foreign & np.isnan(rate)
+    if need_lookup.any() and fx_rates is not None:
+        idx = np.flatnonzero(need_lookup)
+        rate[idx] = lookup_fx_rates(df['거래일자'].to_numpy()[idx], currency[idx], fx_rates)
+
+    amount = np.where(foreign, foreign_amount, df['거래금액'].to_numpy(dtype=float))
+    factor = np.where(foreign, rate, 1.0)
+    tax = df['제세금합'].to_numpy(dtype=float)
+    unresolved = foreign & np.isnan(rate)
+    return amount * factor, (amount - tax) * factor, unresolved
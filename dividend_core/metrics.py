@@ -0,0 +1,154 @@
+import contextvars
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# 현재 실행에서 측정 중인 StageProfiler (없으면 stage()는 아무 일도 하지 않음)
+_ACTIVE_PROFILER = contextvars.ContextVar("dividend_profiler", default=None)
+
+# tracemalloc은 프로세스 전체에 하나이므로, 여러 세션이 동시에 측정할 때를 위해 사용 중인 프로파일러 수를 셈
+_TRACE_LOCK = threading.Lock()
+_trace_users = 0
+_trace_started = False  # 이 모듈이 tracemalloc을 시작했는지 (다른 곳에서 시작한 추적은 멈추지 않음)
+_trace_overlaps = 0  # 다른 프로파일러가 측정 중일 때 새 프로파일러가 시작한 횟수
+
+
+def append_jsonl(path, *records):
+    """Appends each record as one JSON line to `path`, creating parent directories as needed."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+class StageProfiler:
+    """Collects named wall times and peak-memory deltas of the stages of one run (opt-in).
+
+    While started, every `stage(name)` block in the pipeline, the reports and the dashboard is
+    recorded here; when no profiler is active those blocks cost a context-variable lookup.
+
+    Peak memory comes from tracemalloc, whose peak is process-wide, so it is measured only on the
+    thread that started the profiler and only while no other profiler is measuring: a stage that
+    overlaps another profiler (e.g. a second session) records wall time only, since their peak
+    resets would interfere. Allocations of unprofiled threads running at the same time are still
+    included. When tracemalloc was already started elsewhere (e.g. by a benchmark harness), the
+    profiler leaves it alone and records wall time only.
+    """
+
+    def __init__(self, trace_memory=True):
+        self.trace_memory = trace_memory
+        self.records = []
+        self._lock = threading.Lock()
+        self._stack = []  # 시작한 스레드의 중첩된 stage별 {"start": 시작 시 메모리, "peak": 하위 stage 최대치}
+        self._depth = threading.local()
+        self._thread = None
+        self._token = None
+        self._tracing = False
+
+    def start(self):
+        """Makes this the active profiler of the current context and starts tracemalloc if needed."""
+        global _trace_users, _trace_started, _trace_overlaps
+        if self.trace_memory:
+            with _TRACE_LOCK:
+                if _trace_users == 0 and not tracemalloc.is_tracing():
+                    tracemalloc.start()
+                    _trace_started = True
+                if _trace_started:
+                    if _trace_users:
+                        _trace_overlaps += 1
+                    _trace_users += 1
+                    self._tracing = True
+        self._thread = threading.get_ident()
+        self._token = _ACTIVE_PROFILER.set(self)
+        return self
+
+    def stop(self):
+        """Deactivates the profiler; the collected records stay available."""
+        if self._token is not None:
+            _ACTIVE_PROFILER.reset(self._token)
+            self._token = None
+        global _trace_users, _trace_started
+        if self._tracing:
+            with _TRACE_LOCK:
+                _trace_users -= 1
+                if _trace_users == 0 and _trace_started:
+                    tracemalloc.stop()
+                    _trace_started = False
+            self._tracing = False
+
+    @contextmanager
+    def activate(self):
+        self.start()
+        try:
+            yield self
+        finally:
+            self.stop()
+
+    @contextmanager
+    def stage(self, name, **fields):
+        """Times the enclosed block; the yielded dict can be filled with extra fields for the record."""
+        # 다른 프로파일러가 측정 중이면 최대치를 초기화하지 않고 시간만 기록
+        with _TRACE_LOCK:
+            overlaps = _trace_overlaps
+            measure_memory = self._tracing and threading.get_ident() == self._thread and _trace_users == 1
+        if measure_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                self._stack[-1]["peak"] = max(self._stack[-1]["peak"], peak)
+            # 이 stage의 최대 메모리만 보도록 초기화 (상위 stage에는 종료 시 반영)
+            tracemalloc.reset_peak()
+            frame = {"start": current, "peak": 0}
+            self._stack.append(frame)
+        depth = getattr(self._depth, "value", 0)
+        self._depth.value = depth + 1
+
+        start = time.perf_counter()
+        try:
+            yield fields
+        finally:
+            record = {"stage": name, "seconds": round(time.perf_counter() - start, 6), "depth": depth}
+            self._depth.value = depth
+            if measure_memory:
+                self._stack.pop()
+                peak = max(tracemalloc.get_traced_memory()[1], frame["peak"])
+                # 측정 도중 다른 프로파일러가 시작했다면 그쪽의 초기화로 최대치를 믿을 수 없음
+                if _trace_overlaps == overlaps:
+                    record["peak_mb"] = round((peak - frame["start"]) / 1024 / 1024, 3)
+                if self._stack:
+                    self._stack[-1]["peak"] = max(self._stack[-1]["peak"], peak)
+            else:
+                record["thread"] = threading.current_thread().name
+            record.update(fields)
+            with self._lock:
+                self.records.append(record)
+
+    def write_jsonl(self, path, **common):
+        """Appends every record, merged with `common` (e.g. timestamp, run id), as JSON lines."""
+        append_jsonl(path, *({**common, **record} for record in self.records))
+
+
+def active_profiler():
+    """Returns the StageProfiler active in the current context, or None."""
+    return _ACTIVE_PROFILER.get()
+
+
+@contextmanager
+def stage(name, **fields):
+    """Records the enclosed block on the active StageProfiler; does nothing when none is active."""
+    profiler = _ACTIVE_PROFILER.get()
+    if profiler is None:
+        yield fields
+        return
+    with profiler.stage(name, **fields) as record_fields:
+        yield record_fields
+
+
+def profile_call(name, fn, *args, **kwargs):
+    """Calls `fn(*args, **kwargs)` inside `stage(name)`."""
+    with stage(name):
+        return fn(*args, **kwargs)
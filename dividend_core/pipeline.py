@@ -0,0 +1,144 @@
+import numpy as np
+import pandas as pd
+
+from .fx import convert_to_krw
+from .metrics import stage
+from .reader import iter_csv_chunks, read_workbook
+
+DIV_KEYWORDS = ["배당금외화입금", "배당금입금", "ETF분배금입금", "현금배당", "ETF/상장클래스 분배금입금"]
+
+# --- 메모리 절약형 배당 데이터 ---
+# 대시보드에서 사용하는 컬럼만 유지 (거래금액은 저장소 중복 제거 키로 사용)
+COMPACT_COLUMNS = ['거래일자', '거래종류', '종목명', '계좌', '소유주', '통화코드',
+                   '거래금액', '제세금합', '배당금(세전)', '배당금(세후)', '연도', '월']
+CATEGORICAL_COLUMNS = ['거래종류', '종목명', '계좌', '소유주', '통화코드']
+
+# --- 집계 큐브 ---
+CUBE_DIMENSIONS = ['소유주', '계좌', '종목명', '연도', '월']
+CUBE_MEASURES = ['배당금(세전)', '배당금(세후)', '제세금합']
+
+
+# --- 엑셀 로드 및 정규화 ---
+def load_dividend_data(file_bytes, engine="auto", parallel=True, max_workers=None, fx_rates=None):
+    """Parses the workbook bytes and returns the normalized dividend frame."""
+    # [3] 엑셀 파일 읽기 및 시트 병합 (시트별 병렬 파싱, 사용 컬럼만 로드)
+    with stage("excel_parse") as fields:
+        df_all = read_workbook(file_bytes, engine=engine, parallel=parallel, max_workers=max_workers)
+        fields["rows"] = len(df_all)
+    return normalize_dividends(df_all, fx_rates=fx_rates)
+
+
+def load_dividend_csv(source, chunksize=100_000, encoding=None, fx_rates=None):
+    """Streams a CSV transaction export and returns the normalized dividend frame.
+
+    Each chunk is filtered to dividend rows and normalized as soon as it is read, so peak memory
+    grows with the number of dividend rows rather than with the total number of transactions.
+    """
+    parts = []
+    fx_unresolved_rows = 0
+    bytes_uncompacted = 0
+    with stage("csv_stream") as fields:
+        fields["rows"] = 0
+        for chunk in iter_csv_chunks(source, chunksize=chunksize, encoding=encoding):
+            fields["rows"] += len(chunk)
+            part = normalize_dividends(chunk, fx_rates=fx_rates)
+            fx_unresolved_rows += part.attrs.get("fx_unresolved_rows", 0)
+            bytes_uncompacted += part.attrs.get("bytes_uncompacted", 0)
+            if not part.empty:
+                parts.append(part)
+
+    if parts:
+        # 청크마다 범주(category) 구성이 달라 concat 결과가 object가 되므로 다시 압축
+        df_div = compact_dividends(pd.concat(parts, ignore_index=True))
+    else:
+        df_div = compact_dividends(pd.DataFrame(columns=COMPACT_COLUMNS))
+    df_div.attrs["fx_unresolved_rows"] = fx_unresolved_rows
+    df_div.attrs["bytes_uncompacted"] = bytes_uncompacted
+    return df_div
+
+
+def normalize_dividends(df_all, fx_rates=None):
+    """Filters raw transactions to dividend rows and derives the KRW amount and 연도/월 columns.
+
+    Foreign-currency rows without a 단가 are converted with `fx_rates` (see `fx.load_fx_rates`).
+    The number of rows whose rate could not be resolved is kept in `attrs["fx_unresolved_rows"]`,
+    and the in-memory size of the dividend rows before compaction in `attrs["bytes_uncompacted"]`.
+    """
+    # [4] 날짜 처리 및 배당 필터링
+    with stage("normalize[4] filter"):
+        df_all["거래일자"] = pd.to_datetime(df_all["거래일자"], errors='coerce')
+        df_div = df_all[df_all["거래종류"].isin(DIV_KEYWORDS)].copy()
+
+    # [5] 결측값 처리 및 배당금 계산 (모든 통화를 한 번의 벡터 연산으로 원화 환산)
+    with stage("normalize[5] krw"):
+        df_div["제세금합"] = df_div["제세금합"].fillna(0)
+        df_div["통화코드"] = df_div["통화코드"].fillna("KRW").astype(str).str.strip().str.upper()
+        before_tax, after_tax, unresolved = convert_to_krw(df_div, fx_rates)
+        df_div["배당금(세전)"] = np.nan_to_num(before_tax, nan=0.0) # 환율을 찾지 못한 행은 0원
+        df_div["배당금(세후)"] = after_tax
+
+        df_div["배당금(세후)"] = df_div["배당금(세후)"].clip(lower=0).fillna(0)
+        # 환율을 찾지 못한 외화 배당 건수 (날짜가 없는 행은 어차피 제외되므로 세지 않음)
+        df_div.attrs["fx_unresolved_rows"] = int((unresolved & df_div["거래일자"].notna().to_numpy()).sum())
+
+    # [6] 연도/월 컬럼 생성
+    with stage("normalize[6] year_month"):
+        df_div["연도"] = df_div["거래일자"].dt.year
+        df_div["월"] = df_div["거래일자"].dt.month
+    # 압축 전 크기는 추정하지 않고 실제 프레임(모든 컬럼, object 문자열)을 측정해 둠
+    df_div.attrs["bytes_uncompacted"] = int(df_div.memory_usage(deep=True, index=False).sum())
+    with stage("compact"):
+        return compact_dividends(df_div)
+
+
+def compact_dividends(df):
+    """Returns a memory-compact copy of the dividend frame.
+
+    Keeps only `COMPACT_COLUMNS`, stores the repeated labels as categoricals and 연도/월 as
+    int16/int8. Amounts stay float64 so that monthly and yearly totals remain exact to the won.
+    Rows without a valid 거래일자 are dropped since no view can place them in a year or month.
+    """
+    df = df[df['연도'].notna()]
+    df = df[[c for c in COMPACT_COLUMNS if c in df.columns]]
+    df = df.astype({c: 'category' for c in CATEGORICAL_COLUMNS if c in df.columns})
+    df = df.astype({'연도': 'int16', '월': 'int8'})
+    return df.reset_index(drop=True)
+
+
+def memory_report(df):
+    """Returns the frame's bytes per row and, when measured, the bytes per row before compaction.
+
+    The size before compaction is the one `normalize_dividends` measured on the dividend rows
+    (`attrs["bytes_uncompacted"]`). The store does not keep attrs, so for frames read back from it
+    `bytes_per_row_uncompacted` is None.
+    """
+    rows = len(df)
+    compact = int(df.memory_usage(deep=True, index=False).sum())
+    uncompacted = df.attrs.get("bytes_uncompacted")
+    return {
+        "rows": rows,
+        "bytes_per_row": compact / rows if rows else 0.0,
+        "bytes_per_row_uncompacted": uncompacted / rows if rows and uncompacted else None,
+    }
+
+
+def build_dividend_cube(df):
+    """Aggregates the dividend frame once into a (소유주, 계좌, 종목명, 연도, 월) × measures cube.
+
+    All dashboard views are answered by slicing this cube, whose size depends on the number
+    of distinct holdings and months rather than on the number of raw transactions.
+    """
+    dims = [c for c in CUBE_DIMENSIONS if c in df.columns]
+    if df.empty or not dims:
+        return pd.DataFrame(columns=CUBE_MEASURES)
+    with stage("build_cube", rows=len(df)):
+        return df.groupby(dims, dropna=False, observed=True)[CUBE_MEASURES].sum().sort_index()
+
+
+def slice_cube(cube, **levels):
+    """Returns the cube rows whose index levels match the given values (lists mean `isin`)."""
+    mask = np.ones(len(cube), dtype=bool)
+    for level, value in levels.items():
+        values = cube.index.get_level_values(level)
+        mask &= values.isin(value) if isinstance(value, (list, tuple, set)) else (values == value)
+    return cube[mask]
@@ -0,0 +1,116 @@
+import codecs
+import io
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pandas as pd
+
+# 대시보드에서 실제로 사용하는 컬럼만 읽음 (나머지 컬럼은 파싱하지 않음)
+USED_COLUMNS = ["거래일자", "거래종류", "종목명", "거래금액", "외화거래금액", "제세금합", "단가", "통화코드", "계좌", "소유주"]
+
+
+# 작업자 프로세스마다 한 번만 전달받는 워크북 바이트 (시트마다 다시 pickle하지 않음)
+_worker_file_bytes = None
+
+
+def _use_column(name):
+    return name in USED_COLUMNS
+
+
+def _pool_context():
+    """Start method for the parsing pool: never fork(), since the caller (e.g. Streamlit) may be multi-threaded."""
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def _init_worker(file_bytes):
+    global _worker_file_bytes
+    _worker_file_bytes = file_bytes
+
+
+def _parse_sheet_in_worker(sheet, engine):
+    return parse_sheet(_worker_file_bytes, sheet, engine)
+
+
+def resolve_engine(preferred="auto"):
+    """Returns the pandas Excel engine to use, or `None` for pandas' default (openpyxl).
+
+    `"auto"` and `"calamine"` pick the Rust-based calamine reader when `python-calamine`
+    is installed and silently fall back to the default reader otherwise.
+    """
+    if preferred in ("auto", "calamine"):
+        try:
+            import python_calamine  # noqa: F401
+            return "calamine"
+        except ImportError:
+            return None
+    if preferred in (None, "", "default"):
+        return None
+    return preferred
+
+
+def parse_sheet(file_bytes, sheet, engine=None):
+    """Parses one year sheet (used columns only) and tags it with the sheet's 연도."""
+    df = pd.read_excel(io.BytesIO(file_bytes), sheet_name=sheet, usecols=_use_column, engine=engine)
+    return df.assign(연도=int(sheet))
+
+
+def read_workbook(file_bytes, engine="auto", parallel=True, max_workers=None):
+    """Reads every year sheet of the workbook and concatenates them into one frame.
+
+    With `parallel=True` and more than one sheet, sheets are parsed concurrently in a
+    process pool; if the pool cannot be started the sheets are parsed serially instead. The pool
+    uses the forkserver (or spawn) start method and sends the workbook once per worker, so each
+    worker holds one copy of it. On small workbooks the process start-up outweighs the gain.
+    """
+    engine = resolve_engine(engine)
+    xls = pd.ExcelFile(io.BytesIO(file_bytes), engine=engine)
+    sheet_names = xls.sheet_names
+
+    frames = None
+    if parallel and len(sheet_names) > 1:
+        workers = min(len(sheet_names), max_workers or os.cpu_count() or 1)
+        if workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context(),
+                                         initializer=_init_worker, initargs=(file_bytes,)) as pool:
+                    frames = list(pool.map(_parse_sheet_in_worker, sheet_names, [engine] * len(sheet_names)))
+            except (BrokenProcessPool, OSError):
+                frames = None  # 프로세스 풀을 사용할 수 없는 환경 -> 순차 파싱
+
+    if frames is None:
+        frames = [xls.parse(sheet, usecols=_use_column).assign(연도=int(sheet)) for sheet in sheet_names]
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def detect_csv_encoding(sample):
+    """Returns "utf-8-sig" when `sample` (leading bytes of the file) decodes as UTF-8, else "cp949".
+
+    Korean brokerages commonly export CSV files in CP949 (EUC-KR).
+    """
+    try:
+        # 청크 경계에서 잘린 멀티바이트 문자는 오류로 보지 않도록 증분 디코더 사용
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        return "utf-8-sig"
+    except UnicodeDecodeError:
+        return "cp949"
+
+
+def iter_csv_chunks(source, chunksize=100_000, encoding=None):
+    """Yields the used columns of a CSV transaction export `chunksize` rows at a time.
+
+    `source` is a path or a binary file object. Only one chunk of raw rows is in memory at once.
+    """
+    if encoding is None:
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as f:
+                encoding = detect_csv_encoding(f.read(65536))
+        else:
+            position = source.tell()
+            encoding = detect_csv_encoding(source.read(65536))
+            source.seek(position)
+    # 금액 컬럼의 천 단위 구분 기호("1,234")도 숫자로 읽음
+    yield from pd.read_csv(source, usecols=_use_column, chunksize=chunksize, encoding=encoding, thousands=",")
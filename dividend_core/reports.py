@@ -0,0 +1,120 @@
+import pandas as pd
+
+from .pipeline import slice_cube
+
+
+def create_stock_dividend_calendar(cube, year, dividend_type='배당금(세후)', account_name=None):
+    """Returns the 종목명 × 월 calendar for one year, with 총합 row and column."""
+    if account_name and account_name != '전체 계좌': # '전체 계좌' 선택 시 필터링하지 않음
+        cube_filtered = slice_cube(cube, 연도=year, 계좌=account_name)
+    else:
+        cube_filtered = slice_cube(cube, 연도=year)
+
+    df_pivot = cube_filtered[dividend_type].groupby(level=['종목명', '월'], observed=True).sum().unstack(level='월', fill_value=0)
+    df_pivot = df_pivot.reindex(columns=range(1, 13), fill_value=0)  # 1~12월 보장
+
+    df_pivot['총합'] = df_pivot.sum(axis=1)
+    total_row = df_pivot.sum(axis=0).to_frame().T
+    total_row.index = ['총합']
+    df_final = pd.concat([df_pivot, total_row])
+    return df_final.round(0).astype(int)
+
+
+def create_account_monthly_calendar(cube, year, dividend_type='배당금(세후)', account_name=None):
+    """Returns the 계좌 × 월 calendar for one year, with a 전체 총합 row."""
+    if account_name and account_name != '전체 계좌':
+        cube_filtered = slice_cube(cube, 연도=year, 계좌=account_name)
+    else:
+        cube_filtered = slice_cube(cube, 연도=year)
+
+    if cube_filtered.empty:
+        return pd.DataFrame()
+
+    # '계좌'를 행으로, '월'을 열로 하는 피벗 테이블 생성
+    df_pivot = cube_filtered[dividend_type].groupby(level=['계좌', '월'], observed=True).sum().unstack(level='월', fill_value=0)
+    df_pivot = df_pivot.reindex(columns=range(1, 13), fill_value=0) # 1~12월 보장
+
+    df_pivot['총합'] = df_pivot.sum(axis=1) # 계좌별 총합
+
+    # 전체 총합 행 추가
+    total_row = df_pivot.sum(axis=0).to_frame().T
+    total_row.index = ['전체 총합']
+    df_final = pd.concat([df_pivot, total_row])
+
+    return df_final.round(0).astype(int)
+
+
+def get_dividend_summary_for_selection(cube, owner_name, account_names, selected_year, dividend_type='배당금(세후)'):
+    """Returns the 계좌 × 월 summary of one owner's selected accounts for one year."""
+    if not account_names:
+        return pd.DataFrame()
+    cube_filtered = slice_cube(cube, 소유주=owner_name, 계좌=list(account_names), 연도=selected_year)
+    if cube_filtered.empty:
+        return pd.DataFrame()
+
+    # '계좌'를 행으로, '월'을 열로 하는 피벗 테이블 생성
+    summary = cube_filtered[dividend_type].groupby(level=['계좌', '월'], observed=True).sum().unstack(level='월', fill_value=0)
+    summary = summary.reindex(columns=range(1, 13), fill_value=0) # 1~12월 보장
+    summary['총합'] = summary.sum(axis=1) # 계좌별 총합
+
+    # 전체 총합 행 추가
+    total_row = summary.sum(axis=0).to_frame().T
+    total_row.index = ['전체 총합']
+    df_final = pd.concat([summary, total_row])
+
+    return df_final.round(0).astype(int)
+
+
+def get_monthly_details_for_selection(df, owner_name, account_names, selected_year, selected_month, dividend_type='배당금(세후)'):
+    """Returns the individual payouts of one month (newest first) followed by a 총합 row."""
+    if not account_names:
+        return pd.DataFrame()
+    df_filtered = df[
+        (df['소유주'] == owner_name) &
+        (df['계좌'].isin(account_names)) &
+        (df['연도'] == selected_year) &
+        (df['월'] == selected_month)
+    ].copy()
+    if df_filtered.empty:
+        return pd.DataFrame()
+    details = df_filtered[['거래일자', '계좌', '종목명', '통화코드', '배당금(세전)', '제세금합', '배당금(세후)']].sort_values(by='거래일자', ascending=False)
+    details['거래일자'] = details['거래일자'].dt.strftime('%Y-%m-%d')
+    total_row = pd.DataFrame({
+        '거래일자': ['총합'], '계좌': [''], '종목명': [''], '통화코드': [''],
+        '배당금(세전)': [details['배당금(세전)'].sum()],
+        '제세금합': [details['제세금합'].sum()],
+        '배당금(세후)': [details['배당금(세후)'].sum()]
+    })
+    details_final = pd.concat([details, total_row], ignore_index=True)
+    return details_final.round(0).astype({col: int for col in ['배당금(세전)', '제세금합', '배당금(세후)']})
+
+
+def get_monthly_totals(cube):
+    """Returns the per-(연도, 월) before/after-tax totals, rounded to whole won."""
+    monthly_data = cube.groupby(level=['연도', '월'], observed=True)[['배당금(세전)', '배당금(세후)']].sum().reset_index()
+    monthly_data[['배당금(세전)', '배당금(세후)']] = monthly_data[['배당금(세전)', '배당금(세후)']].round().astype(int)
+    return monthly_data
+
+
+def get_year_month_matrix(cube, dividend_type='배당금(세후)', owners=None):
+    """Returns the 연도 × 월(1~12) totals in whole won, optionally limited to the given 소유주."""
+    cube_filtered = slice_cube(cube, 소유주=list(owners)) if owners is not None else cube
+    matrix = cube_filtered[dividend_type].groupby(level=['연도', '월'], observed=True).sum().unstack(level='월', fill_value=0)
+    matrix = matrix.reindex(columns=range(1, 13), fill_value=0) # 1~12월 보장
+    return matrix.round().astype(int)
+
+
+def get_annual_dividends(cube):
+    """Returns the after-tax dividend total per 연도."""
+    return cube.groupby(level='연도', observed=True)['배당금(세후)'].sum()
+
+
+def get_annual_dividend_growth(cube):
+    """Returns the annual after-tax totals with the previous year's total and YoY growth (%)."""
+    annual_dividends = get_annual_dividends(cube).reset_index()
+    # 전년 대비 배당 성장률 계산
+    annual_dividends['전년도_배당금'] = annual_dividends['배당금(세후)'].shift(1)
+    # 0으로 나누는 오류 방지 (전년도 배당금이 0이면 NaN)
+    previous = annual_dividends['전년도_배당금'].where(annual_dividends['전년도_배당금'] != 0)
+    annual_dividends['성장률'] = (annual_dividends['배당금(세후)'] - previous) / previous * 100
+    return annual_dividends
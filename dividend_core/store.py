@@ -0,0 +1,96 @@
+import os
+import threading
+
+import pandas as pd
+
+from .metrics import stage
+from .pipeline import compact_dividends
+
+# 같은 거래로 간주하는 키 (재업로드 시 중복 제거 기준)
+STORE_KEY_COLUMNS = ["거래일자", "계좌", "종목명", "거래종류", "거래금액"]
+
+
+class DividendStore:
+    """On-disk Parquet store of the normalized dividend frame, partitioned by 연도.
+
+    Layout: `<root>/연도=<year>/part.parquet`. Upserts only rewrite the partitions of the
+    years present in the new data, and are idempotent: rows are de-duplicated on
+    `STORE_KEY_COLUMNS`, with the most recently uploaded row winning.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self._lock = threading.Lock()
+
+    def _partition_path(self, year):
+        return os.path.join(self.root, f"연도={int(year)}", "part.parquet")
+
+    def years(self):
+        """Returns the years that have a stored partition, in ascending order."""
+        if not os.path.isdir(self.root):
+            return []
+        years = []
+        for name in os.listdir(self.root):
+            if name.startswith("연도=") and os.path.exists(os.path.join(self.root, name, "part.parquet")):
+                years.append(int(name.split("=", 1)[1]))
+        return sorted(years)
+
+    def version(self, years=None):
+        """Returns a string that changes whenever any of the given partitions is rewritten."""
+        years = self.years() if years is None else sorted(years)
+        parts = []
+        for year in years:
+            path = self._partition_path(year)
+            if os.path.exists(path):
+                stat = os.stat(path)
+                parts.append(f"{year}:{stat.st_mtime_ns}:{stat.st_size}")
+        return f"{os.path.abspath(self.root)}|" + ",".join(parts)
+
+    def _read_partition(self, year):
+        import pyarrow.parquet as pq # 저장소를 실제로 읽을 때만 불러옴
+
+        # memory_map으로 읽어 파일 전체를 한 번에 버퍼로 복사하지 않음
+        df = pq.ParquetFile(self._partition_path(year), memory_map=True).read().to_pandas()
+        df.attrs = {}  # 이전에 attrs와 함께 저장된 파티션이 있어도 업로드 단위의 값은 가져오지 않음
+        return df
+
+    def read(self, years=None):
+        """Reads the requested partitions (all when `years` is None) into one frame."""
+        available = set(self.years())
+        years = sorted(available if years is None else set(years) & available)
+        if not years:
+            return pd.DataFrame()
+        with stage("store_read", years=len(years)):
+            # 파티션마다 범주(category) 구성이 달라 concat 결과가 object가 되므로 다시 압축
+            return compact_dividends(pd.concat([self._read_partition(year) for year in years], ignore_index=True))
+
+    def upsert(self, df_new):
+        """Merges `df_new` into the store and returns the number of newly added rows.
+
+        Rows without a valid 연도 (unparseable 거래일자) are not stored, and neither are the
+        frame's attrs: they describe the whole upload, not the rows of one partition.
+        """
+        df_new = df_new[df_new["연도"].notna()].astype({"연도": int, "월": int})
+        added = 0
+        with self._lock, stage("store_upsert", rows=len(df_new)):
+            for year, df_year in df_new.groupby("연도"):
+                path = self._partition_path(year)
+                if os.path.exists(path):
+                    df_old = self._read_partition(year)
+                    before = len(df_old)
+                    combined = pd.concat([df_old, df_year], ignore_index=True)
+                else:
+                    before = 0
+                    combined = df_year
+
+                # 키 컬럼 인덱스 기준으로 중복 제거 (나중에 업로드된 행 우선)
+                combined = combined.set_index(STORE_KEY_COLUMNS, drop=False)
+                combined = combined[~combined.index.duplicated(keep="last")].reset_index(drop=True)
+                added += len(combined) - before
+                combined.attrs = {}  # to_parquet은 attrs를 메타데이터로 저장하므로 비움
+
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = path + ".tmp"
+                combined.to_parquet(tmp_path, index=False)
+                os.replace(tmp_path, path)  # 원자적 교체로 읽는 쪽이 반쯤 쓴 파일을 보지 않도록 함
+        return added
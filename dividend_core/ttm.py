@@ -0,0 +1,118 @@
+import numpy as np
+import pandas as pd
+
+from .pipeline import slice_cube
+
+TTM_MONTHS = 12
+
+
+def build_ttm_panel(cube, level='종목명', dividend_type='배당금(세후)', owners=None):
+    """Dense (`level` × month) panel of monthly dividends with trailing-12-month windows.
+
+    Months run consecutively from the first to the last month of the cube, so months without
+    a payout are zeros and every rolling window is a difference of cumulative sums over the
+    whole matrix at once. Returns a dict of frames indexed by `level` with monthly Period
+    columns, or None when there is no data:
+
+    - `monthly`: payouts per month
+    - `ttm`: sum of the 12 months ending at each month (shorter at the start of the history)
+    - `ttm_prior`: `ttm` 12 months earlier (NaN for the first year)
+    - `payment_change`: each payout relative to the previous payout of the same row
+      (NaN in months without a payout or for the first payout)
+    """
+    if owners is not None:
+        cube = slice_cube(cube, 소유주=list(owners))
+    if cube.empty:
+        return None
+
+    series = cube[dividend_type].groupby(level=[level, '연도', '월'], observed=True).sum()
+    codes, labels = pd.factorize(series.index.get_level_values(level), sort=True)
+    period = (series.index.get_level_values('연도').to_numpy(dtype=np.int64) * 12
+              + series.index.get_level_values('월').to_numpy(dtype=np.int64) - 1)
+    valid = codes >= 0  # 이름이 비어 있는 행 제외
+    first, last = int(period.min()), int(period.max())
+    months = pd.period_range(pd.Period(year=first // 12, month=first % 12 + 1, freq='M'), periods=last - first + 1)
+
+    monthly = np.zeros((len(labels), len(months)))
+    np.add.at(monthly, (codes[valid], period[valid] - first), series.to_numpy()[valid])
+
+    # 누적합의 차이로 모든 행/월의 12개월 합계를 한 번에 계산
+    cumulative = np.cumsum(monthly, axis=1)
+    ttm = cumulative.copy()
+    ttm[:, TTM_MONTHS:] -= cumulative[:, :-TTM_MONTHS]
+    ttm = np.round(ttm, 2)  # 누적합 차이의 부동소수점 오차 제거 (지급이 끊긴 창은 정확히 0)
+    ttm_prior = np.full_like(ttm, np.nan)
+    ttm_prior[:, TTM_MONTHS:] = ttm[:, :-TTM_MONTHS]
+
+    # 각 월 직전까지 마지막으로 지급된 월의 위치 (누적 최댓값으로 앞으로 채우기)
+    paid = monthly > 0
+    last_paid = np.maximum.accumulate(np.where(paid, np.arange(len(months)), -1), axis=1)
+    previous = np.full_like(last_paid, -1)
+    previous[:, 1:] = last_paid[:, :-1]
+    rows = np.arange(len(labels))[:, None]
+    previous_amount = np.where(previous >= 0, monthly[rows, np.maximum(previous, 0)], np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        payment_change = np.where(paid, monthly / previous_amount - 1, np.nan)
+
+    index = pd.Index(labels, name=level)
+
+    def frame(values):
+        return pd.DataFrame(values, index=index, columns=months)
+
+    return {
+        'monthly': frame(monthly),
+        'ttm': frame(ttm),
+        'ttm_prior': frame(ttm_prior),
+        'payment_change': frame(payment_change),
+    }
+
+
+def ttm_totals(panel):
+    """Returns the total TTM income per month and its growth (%) over the TTM a year earlier."""
+    total = panel['ttm'].sum(axis=0)
+    prior = total.shift(TTM_MONTHS)
+    growth = (total - prior) / prior.where(prior > 0) * 100
+    return pd.DataFrame({'TTM 배당금': total, '1년 전 TTM': prior, 'TTM 성장률(%)': growth})
+
+
+def ttm_snapshot(panel, month, cut_threshold=0.1):
+    """Per-row TTM table as of `month`, sorted by TTM income, with dividend-cut detection.
+
+    A row is marked '중단' when it paid in the prior 12-month window but not in the current one,
+    '감소' when its latest payout is more than `cut_threshold` below the previous payout, and
+    '신규' when it did not pay in the prior window. Rows without payouts in either window are omitted.
+
+    Payouts are compared in KRW (the normalized frame keeps no original-currency amounts), so a
+    foreign payer with an unchanged dividend is also marked '감소' when the exchange rate moves by
+    more than `cut_threshold` between the two payouts.
+    """
+    col = panel['ttm'].columns.get_loc(month)
+    monthly = panel['monthly'].to_numpy()[:, :col + 1]
+    ttm = panel['ttm'].iloc[:, col]
+    prior = panel['ttm_prior'].iloc[:, col]
+
+    # 기준월까지의 마지막 지급월과 그 지급의 직전 대비 변화율
+    paid = monthly > 0
+    has_paid = paid.any(axis=1)
+    last_col = monthly.shape[1] - 1 - np.argmax(paid[:, ::-1], axis=1)
+    rows = np.arange(len(monthly))
+    last_amount = np.where(has_paid, monthly[rows, last_col], np.nan)
+    last_change = np.where(has_paid, panel['payment_change'].to_numpy()[rows, last_col], np.nan)
+    last_month = np.where(has_paid, panel['ttm'].columns[last_col].astype(str), '')
+
+    status = np.select(
+        [(prior.to_numpy() > 0) & (ttm.to_numpy() <= 0), last_change < -cut_threshold, prior.to_numpy() == 0],
+        ['중단', '감소', '신규'],
+        default='',
+    )
+    snapshot = pd.DataFrame({
+        'TTM 배당금': ttm,
+        '1년 전 TTM': prior,
+        'TTM 성장률(%)': (ttm - prior) / prior.where(prior > 0) * 100,
+        '최근 지급월': last_month,
+        '최근 지급액': last_amount,
+        '직전 대비(%)': last_change * 100,
+        '상태': status,
+    }, index=panel['ttm'].index)
+    active = (snapshot['TTM 배당금'] > 0) | (snapshot['1년 전 TTM'] > 0)
+    return snapshot[active].sort_values('TTM 배당금', ascending=False)
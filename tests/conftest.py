@@ -0,0 +1,36 @@
+import pandas as pd
+import pytest
+
+from dividend_core import COMPACT_COLUMNS, compact_dividends
+
+
+@pytest.fixture
+def make_dividends():
+    """Builds a normalized (compact) dividend frame from `(거래일자, 종목명, 배당금)` tuples.
+
+    Optional keyword arguments fill the remaining columns for every row (계좌, 소유주, 통화코드, ...).
+    """
+    def make(rows, 계좌='일반', 소유주='나', 통화코드='KRW', 거래종류='배당금입금'):
+        dates = pd.to_datetime([date for date, _, _ in rows])
+        amounts = [float(amount) for _, _, amount in rows]
+        df = pd.DataFrame({
+            '거래일자': dates,
+            '거래종류': 거래종류,
+            '종목명': [name for _, name, _ in rows],
+            '계좌': 계좌,
+            '소유주': 소유주,
+            '통화코드': 통화코드,
+            '거래금액': amounts,
+            '제세금합': 0.0,
+            '배당금(세전)': amounts,
+            '배당금(세후)': amounts,
+            '연도': dates.year,
+            '월': dates.month,
+        }, columns=COMPACT_COLUMNS)
+        return compact_dividends(df)
+    return make
+
+
+def monthly_rows(name, start, months, amount):
+    """`(거래일자, 종목명, 배당금)` rows paying `amount` on the 15th of `months` consecutive months."""
+    return [(date.strftime('%Y-%m-15'), name, amount) for date in pd.date_range(start, periods=months, freq='MS')]
@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+
+from dividend_core import amount_table, bold_rows, page_count, paginate
+
+
+def test_amount_table_keeps_numbers_and_blanks_zeros():
+    calendar = pd.DataFrame({1: [1234.4, 0], 2: [0, 9000], '총합': [1234.4, 9000]}, index=['AAPL', '총합'])
+
+    table = amount_table(calendar)
+
+    assert table.columns.tolist() == ['1', '2', '총합']
+    assert all(pd.api.types.is_float_dtype(dtype) for dtype in table.dtypes)
+    np.testing.assert_array_equal(table['1'], [1234.0, np.nan])
+    assert calendar.loc['총합', 2] == 9000  # 원본은 그대로
+
+
+def test_amount_table_only_touches_given_columns():
+    details = pd.DataFrame({'거래일자': ['2024-01-15', '총합'], '배당금(세후)': [0.0, 10.6], '건수': [0, 1]})
+
+    table = amount_table(details, columns=['배당금(세후)'], blank_zero=False)
+
+    assert table['배당금(세후)'].tolist() == [0.0, 11.0]
+    assert table['건수'].tolist() == [0, 1]
+    assert table['거래일자'].tolist() == ['2024-01-15', '총합']
+
+
+def test_bold_rows_formats_display_text_only():
+    calendar = pd.DataFrame({1: [1234.4, 0], '성장률': [12.345, np.nan], '총합': [1234.4, 9000]}, index=['AAPL', '총합'])
+    table = amount_table(calendar, columns=[1, '총합'])
+
+    styler = bold_rows(table, ['총합', '없는 행'], ['1', '총합'], formats={'성장률': '{:.2f}%'})
+    html = styler.to_html()
+
+    assert styler.data is table and pd.api.types.is_float_dtype(table['총합'])
+    assert '1,234' in html and '9,000' in html and '12.35%' in html and 'nan' not in html
+    assert html.count('font-weight: bold') == 1  # 총합 행의 셀에 한 규칙으로 적용
+
+
+def test_paginate_keeps_total_row_on_every_page():
+    df = pd.DataFrame({'x': range(6)})  # 마지막 행이 총합
+
+    assert page_count(5, 2) == 3
+    assert paginate(df, 2, 2, keep_last=True)['x'].tolist() == [2, 3, 5]
+    assert paginate(df, 3, 2, keep_last=True)['x'].tolist() == [4, 5]
@@ -0,0 +1,37 @@
+import io
+
+from openpyxl import load_workbook
+
+from dividend_core import build_dividend_cube, write_report_workbook
+
+from conftest import monthly_rows
+
+
+def read_sheet(ws):
+    """Returns the sheet as a list of `(value, number_format)` rows."""
+    return [[(cell.value, cell.number_format) for cell in row] for row in ws.iter_rows()]
+
+
+def test_growth_sheet_keeps_years_plain_and_zero_growth(make_dividends):
+    # 2023년과 2024년의 배당금이 같으므로 2024년 성장률은 0%
+    cube = build_dividend_cube(make_dividends(monthly_rows('AAPL', '2023-01-01', 24, 100)))
+    target = io.BytesIO()
+    write_report_workbook(cube, target, max_workers=1)
+
+    rows = read_sheet(load_workbook(target)['연도별 성장률'])
+
+    assert [value for value, _ in rows[0]] == ['연도', '배당금(세후)', '전년도_배당금', '성장률']
+    assert rows[2] == [(2024, 'General'), (1200, '#,##0'), (1200, '#,##0'), (0, '0.00"%"')]
+    assert rows[1][0] == (2023, 'General')
+    assert rows[1][3][0] is None  # 전년도가 없는 첫해 성장률
+
+
+def test_calendar_sheet_blanks_zero_amounts(make_dividends):
+    cube = build_dividend_cube(make_dividends([('2024-01-15', 'AAPL', 1500), ('2024-03-15', 'AAPL', 500)]))
+    target = io.BytesIO()
+    write_report_workbook(cube, target, max_workers=1)
+
+    rows = read_sheet(load_workbook(target)['2024 종목별'])
+
+    assert rows[1][:4] == [('AAPL', 'General'), (1500, '#,##0'), (None, 'General'), (500, '#,##0')]
+    assert rows[1][-1] == (2000, '#,##0')
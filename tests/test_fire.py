@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from dividend_core import (
+    build_dividend_cube,
+    dividend_baseline,
+    estimate_dividend_growth,
+    simulate_fire,
+    summarize_fire,
+)
+from dividend_core.fire import DEFAULT_GROWTH
+
+from conftest import monthly_rows
+
+
+def simulate_fire_loop(current_annual, monthly_goal, growth, inflation, monthly_contribution,
+                       dividend_yield, horizon, paths, seed):
+    """Year-by-year recurrence D_k = D_{k-1}·e^{g_k} + a with the same random draws as `simulate_fire`."""
+    rng = np.random.default_rng(seed)
+    g = rng.normal(growth[0], growth[1], size=(paths, horizon))
+    pi = rng.normal(inflation[0], inflation[1], size=(paths, horizon))
+    added = monthly_contribution * 12 * dividend_yield
+
+    years_to_goal = np.full(paths, np.nan)
+    for p in range(paths):
+        dividends, goal = current_annual, monthly_goal * 12
+        for k in range(horizon):
+            dividends = dividends * np.exp(g[p, k]) + added
+            goal = goal * np.exp(pi[p, k])
+            if dividends >= goal:
+                years_to_goal[p] = k + 1
+                break
+    return years_to_goal
+
+
+def test_closed_form_matches_recurrence():
+    args = dict(current_annual=12_000_000, monthly_goal=3_000_000, growth=(0.05, 0.1), inflation=(0.025, 0.01),
+                monthly_contribution=1_000_000, dividend_yield=0.04, horizon=30, paths=300, seed=7)
+
+    expected = simulate_fire_loop(**args)
+    actual = simulate_fire(**args)
+
+    np.testing.assert_array_equal(actual, expected)
+
+
+def test_goal_already_met_and_never_met():
+    met = simulate_fire(10_000_000, 100_000, growth=(0.0, 0.0), inflation=(0.0, 0.0), horizon=5, paths=10)
+    assert (met == 1).all()
+
+    never = simulate_fire(1_000_000, 1_000_000, growth=(0.0, 0.0), inflation=(0.0, 0.0), horizon=5, paths=10)
+    assert np.isnan(never).all()
+    summary = summarize_fire(never, 2025)
+    assert summary["probability"] == 0.0
+    assert summary["percentiles"] == {10: None, 50: None, 90: None}
+    assert summary["distribution"].empty
+
+
+def test_summary_percentiles_and_distribution():
+    years_to_goal = np.array([1, 2, 2, 3, np.nan] * 2, dtype=float)
+
+    summary = summarize_fire(years_to_goal, 2025)
+
+    assert summary["probability"] == 0.8
+    assert summary["percentiles"] == {10: 2026, 50: 2027, 90: None}
+    assert summary["distribution"]['연도'].tolist() == [2026, 2027, 2028]
+    np.testing.assert_allclose(summary["distribution"]['누적확률'], [0.2, 0.6, 0.8])
+
+
+def test_baseline_drops_partial_first_and_latest_years(make_dividends):
+    # 2021-11부터 매달 100만 원씩 변함없이 받은 이력 (2021년과 2025년은 일부 월만 있음)
+    cube = build_dividend_cube(make_dividends(monthly_rows('FLAT', '2021-11-01', 46, 1_000_000)))
+
+    base_year, ttm, complete_years = dividend_baseline(cube)
+
+    assert (base_year, ttm) == (2025, 12_000_000)
+    assert complete_years.index.tolist() == [2022, 2023, 2024]
+    assert estimate_dividend_growth(complete_years) == (0.0, 0.0)
+
+
+def test_baseline_keeps_full_calendar_years(make_dividends):
+    cube = build_dividend_cube(make_dividends(monthly_rows('FLAT', '2022-01-01', 36, 100)))
+
+    assert dividend_baseline(cube)[2].index.tolist() == [2022, 2023, 2024]
+
+
+def quarterly_rows(name, first_year, last_year, amount, growth=0.0, months=(3, 6, 9, 12)):
+    """Rows paying in the given months of every year, the payout growing by `growth` a year."""
+    return [(f'{year}-{month:02d}-15', name, amount * (1 + growth) ** (year - first_year))
+            for year in range(first_year, last_year + 1) for month in months]
+
+
+def test_baseline_keeps_full_years_of_a_quarterly_payer(make_dividends):
+    # 3/6/9/12월 분기 배당: 1월에 시작하지 않아도 첫해는 온전한 해
+    cube = build_dividend_cube(make_dividends(quarterly_rows('QTR', 2021, 2024, 1000)))
+    assert dividend_baseline(cube)[2].index.tolist() == [2021, 2022, 2023, 2024]
+
+    growing = build_dividend_cube(make_dividends(quarterly_rows('QTR', 2023, 2024, 1000, growth=0.1)))
+    complete_years = dividend_baseline(growing)[2]
+
+    assert complete_years.index.tolist() == [2023, 2024]
+    assert estimate_dividend_growth(complete_years) == (pytest.approx(np.log(1.1)), DEFAULT_GROWTH[1])
+
+
+def test_baseline_drops_quarterly_year_in_progress(make_dividends):
+    rows = quarterly_rows('QTR', 2022, 2023, 1000) + quarterly_rows('QTR', 2024, 2024, 1000, months=(3, 6, 9))
+    assert dividend_baseline(build_dividend_cube(make_dividends(rows)))[2].index.tolist() == [2022, 2023]
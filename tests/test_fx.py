@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+from dividend_core import convert_to_krw, lookup_fx_rates
+
+FX = pd.DataFrame({
+    '날짜': pd.to_datetime(['2024-01-02', '2024-01-10', '2024-01-05']),
+    '통화코드': ['USD', 'USD', 'JPY'],
+    '환율': [1300.0, 1350.0, 9.0],
+}).sort_values('날짜', ignore_index=True)
+
+
+def test_lookup_uses_latest_rate_on_or_before_date_per_currency():
+    dates = pd.to_datetime(['2024-01-01', '2024-01-02', '2024-01-09', '2024-01-10', '2024-01-31', '2024-01-06'])
+    currencies = ['USD', 'USD', 'USD', 'USD', 'USD', 'JPY']
+
+    rates = lookup_fx_rates(dates, currencies, FX)
+
+    np.testing.assert_array_equal(rates, [np.nan, 1300.0, 1300.0, 1350.0, 1350.0, 9.0])
+
+
+def test_lookup_keeps_input_order_and_handles_missing_table():
+    dates = pd.to_datetime(['2024-01-20', '2024-01-03'])
+    np.testing.assert_array_equal(lookup_fx_rates(dates, ['USD', 'USD'], FX), [1350.0, 1300.0])
+    assert np.isnan(lookup_fx_rates(dates, ['USD', 'USD'], None)).all()
+
+
+def test_convert_to_krw_prefers_row_rate_then_table():
+    df = pd.DataFrame({
+        '거래일자': pd.to_datetime(['2024-01-15', '2024-01-15', '2024-01-15', '2023-12-01']),
+        '통화코드': ['USD', 'USD', 'KRW', 'USD'],
+        '외화거래금액': [10.0, 10.0, np.nan, 10.0],
+        '단가': [1400.0, np.nan, np.nan, np.nan],
+        '거래금액': [0.0, 0.0, 5000.0, 0.0],
+        '제세금합': [1.0, 1.0, 500.0, 0.0],
+    })
+
+    before_tax, after_tax, unresolved = convert_to_krw(df, FX)
+
+    np.testing.assert_array_equal(before_tax, [14000.0, 13500.0, 5000.0, np.nan])
+    np.testing.assert_array_equal(after_tax, [12600.0, 12150.0, 4500.0, np.nan])
+    assert unresolved.tolist() == [False, False, False, True]  # 첫 환율 이전 날짜
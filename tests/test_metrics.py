@@ -0,0 +1,59 @@
+import tracemalloc
+
+from dividend_core import StageProfiler, active_profiler, stage
+
+
+def by_stage(profiler):
+    return {record["stage"]: record for record in profiler.records}
+
+
+def test_stage_without_profiler_records_nothing():
+    assert active_profiler() is None
+    with stage("ignored") as fields:
+        fields["rows"] = 1
+
+
+def test_records_nested_stages_and_peak_memory():
+    assert not tracemalloc.is_tracing()
+    with StageProfiler().activate() as profiler:
+        assert tracemalloc.is_tracing()
+        with stage("outer", rows=3):
+            with stage("inner"):
+                data = bytearray(2 * 1024 * 1024)
+            del data
+    assert not tracemalloc.is_tracing()
+
+    records = by_stage(profiler)
+    assert records["outer"]["depth"] == 0 and records["inner"]["depth"] == 1
+    assert records["outer"]["rows"] == 3
+    assert records["inner"]["peak_mb"] >= 2
+    assert records["outer"]["peak_mb"] >= records["inner"]["peak_mb"]
+
+
+def test_leaves_tracing_started_elsewhere_alone():
+    tracemalloc.start()
+    try:
+        with StageProfiler().activate() as profiler:
+            with stage("timed"):
+                pass
+        assert tracemalloc.is_tracing()
+        assert "peak_mb" not in by_stage(profiler)["timed"]
+    finally:
+        tracemalloc.stop()
+
+
+def test_overlapping_profilers_record_time_only():
+    first = StageProfiler().start()
+    with first.stage("overlapped"):
+        second = StageProfiler().start()
+        with second.stage("shared"):
+            pass
+        second.stop()
+    with first.stage("alone"):
+        pass
+    first.stop()
+
+    assert not tracemalloc.is_tracing()
+    assert "peak_mb" not in by_stage(first)["overlapped"]
+    assert "peak_mb" not in by_stage(second)["shared"]
+    assert "peak_mb" in by_stage(first)["alone"]
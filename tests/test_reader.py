@@ -0,0 +1,35 @@
+import io
+
+import pandas as pd
+import pytest
+
+from dividend_core import read_workbook
+
+
+@pytest.fixture
+def workbook_bytes():
+    buffer = io.BytesIO()
+    with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
+        for year in (2023, 2024, 2025):
+            pd.DataFrame({
+                '거래일자': [f'{year}-01-15', f'{year}-02-15'],
+                '거래종류': ['배당금입금', '매수'],
+                '종목명': ['KT&G', 'AAPL'],
+                '거래금액': [1000, 2000],
+                '메모': ['사용하지 않는 컬럼', ''],
+            }).to_excel(writer, sheet_name=str(year), index=False)
+    return buffer.getvalue()
+
+
+def test_reads_used_columns_of_every_year_sheet(workbook_bytes):
+    df = read_workbook(workbook_bytes, engine='openpyxl', parallel=False)
+
+    assert df['연도'].tolist() == [2023, 2023, 2024, 2024, 2025, 2025]
+    assert '메모' not in df.columns
+
+
+def test_parallel_parse_matches_serial(workbook_bytes):
+    serial = read_workbook(workbook_bytes, engine='openpyxl', parallel=False)
+    parallel = read_workbook(workbook_bytes, engine='openpyxl', parallel=True, max_workers=2)
+
+    pd.testing.assert_frame_equal(parallel, serial)
@@ -0,0 +1,73 @@
+import pandas as pd
+
+from dividend_core import (
+    DividendStore,
+    build_dividend_cube,
+    create_account_monthly_calendar,
+    create_stock_dividend_calendar,
+    get_dividend_summary_for_selection,
+    memory_report,
+    normalize_dividends,
+)
+
+
+def two_owner_cube(make_dividends):
+    df = pd.concat([
+        make_dividends([('2024-01-15', 'AAPL', 100), ('2024-02-15', 'MSFT', 50)], 소유주='아빠', 계좌='ISA'),
+        make_dividends([('2024-03-15', 'KT&G', 70)], 소유주='엄마', 계좌='연금'),
+    ], ignore_index=True)
+    # 소유주/계좌/종목명은 범주형이므로, 다른 행에만 있는 범주가 빈 행으로 나오면 안 됨
+    return build_dividend_cube(df.astype({'소유주': 'category', '계좌': 'category', '종목명': 'category'}))
+
+
+def test_single_account_calendar_lists_only_that_accounts_stocks(make_dividends):
+    cube = two_owner_cube(make_dividends)
+
+    calendar = create_stock_dividend_calendar(cube, 2024, account_name='연금')
+
+    assert calendar.index.tolist() == ['KT&G', '총합']
+    assert calendar.loc['총합', '총합'] == 70
+    assert create_account_monthly_calendar(cube, 2024, account_name='ISA').index.tolist() == ['ISA', '전체 총합']
+
+
+def test_owner_summary_lists_only_the_owners_accounts(make_dividends):
+    cube = two_owner_cube(make_dividends)
+
+    summary = get_dividend_summary_for_selection(cube, '아빠', ['ISA'], 2024)
+
+    assert summary.index.tolist() == ['ISA', '전체 총합']
+    assert summary.loc['ISA', [1, 2, '총합']].tolist() == [100, 50, 150]
+
+
+RAW = pd.DataFrame({
+    '거래일자': ['2023-12-15', '2024-01-15', '2024-02-15', '2024-02-20'],
+    '거래종류': ['배당금입금', '배당금입금', '배당금입금', '매수'],
+    '종목명': ['KT&G'] * 4,
+    '거래금액': [1000.0, 1000.0, 1000.0, 50000.0],
+    '외화거래금액': [None] * 4,
+    '제세금합': [154.0, 154.0, 154.0, 0.0],
+    '단가': [None] * 4,
+    '통화코드': ['KRW'] * 4,
+    '계좌': ['일반'] * 4,
+    '소유주': ['나'] * 4,
+})
+
+
+def test_memory_report_uses_size_measured_before_compaction():
+    df_div = normalize_dividends(RAW)
+    report = memory_report(df_div)
+
+    assert report["rows"] == 3
+    assert report["bytes_per_row_uncompacted"] == df_div.attrs["bytes_uncompacted"] / 3
+
+
+def test_store_does_not_bring_back_upload_attrs(tmp_path):
+    store = DividendStore(str(tmp_path / "store"))
+    df_div = normalize_dividends(RAW)
+    store.upsert(df_div)
+    assert df_div.attrs["bytes_uncompacted"] > 0  # 업로드 프레임의 attrs는 그대로
+
+    # 업로드 전체의 압축 전 크기를 한 해의 행 수로 나눈 값이 나오면 안 됨
+    stored = store.read([2024])
+    assert stored.attrs == {}
+    assert memory_report(stored)["bytes_per_row_uncompacted"] is None
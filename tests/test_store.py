@@ -0,0 +1,36 @@
+from dividend_core import DividendStore
+
+
+def test_upsert_is_idempotent(tmp_path, make_dividends):
+    store = DividendStore(str(tmp_path / "store"))
+    df = make_dividends([('2023-03-15', 'AAPL', 100), ('2024-03-15', 'AAPL', 110), ('2024-06-15', 'MSFT', 50)])
+
+    assert store.upsert(df) == 3
+    assert store.upsert(df) == 0
+    assert store.years() == [2023, 2024]
+    assert len(store.read()) == 3
+
+
+def test_upsert_deduplicates_on_key_and_keeps_latest_row(tmp_path, make_dividends):
+    store = DividendStore(str(tmp_path / "store"))
+    store.upsert(make_dividends([('2024-03-15', 'AAPL', 100)]))
+
+    # 같은 키(거래일자, 계좌, 종목명, 거래종류, 거래금액)의 행이 다시 올라오면 나중 행이 남음
+    updated = make_dividends([('2024-03-15', 'AAPL', 100), ('2024-04-15', 'AAPL', 100)])
+    updated['배당금(세후)'] = 90.0
+    assert store.upsert(updated) == 1
+
+    stored = store.read().sort_values('거래일자')
+    assert stored['배당금(세후)'].tolist() == [90.0, 90.0]
+
+
+def test_read_selected_years_and_version(tmp_path, make_dividends):
+    store = DividendStore(str(tmp_path / "store"))
+    store.upsert(make_dividends([('2023-03-15', 'AAPL', 100), ('2024-03-15', 'AAPL', 110)]))
+    version = store.version([2023])
+
+    assert store.read([2024])['연도'].tolist() == [2024]
+    assert store.read([2030]).empty
+
+    store.upsert(make_dividends([('2024-05-15', 'MSFT', 10)]))
+    assert store.version([2023]) == version  # 다시 쓰지 않은 파티션의 버전은 그대로
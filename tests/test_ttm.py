@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dividend_core import build_dividend_cube, build_ttm_panel, ttm_snapshot, ttm_totals
+
+from conftest import monthly_rows
+
+
+def test_ttm_equals_rolling_twelve_month_sum(make_dividends):
+    rng = np.random.default_rng(0)
+    rows = [(date.strftime('%Y-%m-10'), name, float(rng.integers(1, 100)))
+            for name in ('AAPL', 'KT&G')
+            for date in pd.date_range('2021-03-01', '2024-08-01', freq='MS') if rng.random() < 0.6]
+    panel = build_ttm_panel(build_dividend_cube(make_dividends(rows)))
+
+    expected = panel['monthly'].T.rolling(12, min_periods=1).sum().T
+    pd.testing.assert_frame_equal(panel['ttm'], expected.round(2))
+    pd.testing.assert_frame_equal(panel['ttm_prior'].iloc[:, 12:], panel['ttm'].iloc[:, :-12].set_axis(
+        panel['ttm'].columns[12:], axis=1))
+    assert panel['ttm_prior'].iloc[:, :12].isna().all().all()
+
+
+def test_months_without_payouts_are_zero_columns(make_dividends):
+    panel = build_ttm_panel(build_dividend_cube(make_dividends([('2024-01-15', 'AAPL', 10), ('2024-04-15', 'AAPL', 20)])))
+
+    assert panel['monthly'].columns.astype(str).tolist() == ['2024-01', '2024-02', '2024-03', '2024-04']
+    assert panel['monthly'].loc['AAPL'].tolist() == [10.0, 0.0, 0.0, 20.0]
+    assert panel['payment_change'].loc['AAPL', pd.Period('2024-04', 'M')] == 1.0
+
+
+def test_snapshot_status_flags(make_dividends):
+    rows = (
+        monthly_rows('FLAT', '2023-01-01', 24, 100)
+        + monthly_rows('CUT', '2023-01-01', 23, 100) + [('2024-12-15', 'CUT', 80)]
+        + monthly_rows('SMALL', '2023-01-01', 23, 100) + [('2024-12-15', 'SMALL', 95)]
+        + monthly_rows('STOPPED', '2023-01-01', 12, 100)
+        + monthly_rows('NEW', '2024-06-01', 7, 100)
+    )
+    panel = build_ttm_panel(build_dividend_cube(make_dividends(rows)))
+
+    snapshot = ttm_snapshot(panel, pd.Period('2024-12', 'M'), cut_threshold=0.1)
+
+    assert snapshot['상태'].to_dict() == {'FLAT': '', 'CUT': '감소', 'SMALL': '', 'STOPPED': '중단', 'NEW': '신규'}
+    assert snapshot.loc['FLAT', 'TTM 배당금'] == 1200
+    assert snapshot.loc['CUT', '직전 대비(%)'] == pytest.approx(-20)
+    assert snapshot.loc['STOPPED', 'TTM 배당금'] == 0
+    assert snapshot['TTM 배당금'].is_monotonic_decreasing
+
+
+def test_totals_and_owner_filter(make_dividends):
+    df = pd.concat([
+        make_dividends(monthly_rows('AAPL', '2023-01-01', 24, 100), 소유주='나'),
+        make_dividends(monthly_rows('AAPL', '2023-01-01', 24, 50), 소유주='엄마'),
+    ])
+    cube = build_dividend_cube(df.astype({'소유주': 'category', '종목명': 'category'}))
+
+    totals = ttm_totals(build_ttm_panel(cube))
+    assert totals['TTM 배당금'].iloc[-1] == 1800
+    assert totals['TTM 성장률(%)'].iloc[-1] == 0
+
+    mine = build_ttm_panel(cube, owners=['나'])
+    assert mine['ttm'].iloc[:, -1].sum() == 1200
+    assert build_ttm_panel(cube, owners=['없는 사람']) is None